@@ -1,7 +1,7 @@
 import dataclasses
+import functools
 import inspect
-
-import typing_inspect
+import types
 
 from . import _docstring_parser as dsp
 from ._core import *
@@ -17,22 +17,35 @@ from .random import *
 from .strings import *
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ArgMetadata:
     type: type
     default_value: typ.Any
     doc: str = None
 
 
-@dataclasses.dataclass(frozen=True)
 class OperationMetadata:
-    name: str
-    args: dict[str, ArgMetadata]
-    doc: str = None
-    special: bool = False
+    """Metadata of an operation. If no arguments metadata is given, it is computed
+    from the given constructor the first time it is accessed."""
+
+    __slots__ = ('name', 'doc', 'special', '_args', '_init')
+
+    def __init__(self, name: str, args: dict[str, ArgMetadata] = None, doc: str = None, special: bool = False,
+                 init: typ.Callable = None):
+        self.name = name
+        self.doc = doc
+        self.special = special
+        self._args = args
+        self._init = init
 
+    @property
+    def args(self) -> dict[str, ArgMetadata]:
+        if self._args is None:
+            self._args = _get_args_metadata(self._init)
+        return self._args
 
-OperationsMetadada = dict[str, OperationMetadata]
+
+OperationsMetadada = typ.Mapping[str, OperationMetadata]
 
 _OPERATIONS = {}
 _OPS_METADATA = {
@@ -60,33 +73,58 @@ _OPS_METADATA = {
 }
 
 
+_parse_docstring_cached = functools.lru_cache(maxsize=None)(dsp.parse_docstring)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_annotations_cached(f: typ.Callable) -> dict[str, typ.Any]:
+    # Evaluate string annotations as the resulting types are used to cast arguments
+    return inspect.get_annotations(f, eval_str=True)
+
+
+def _get_args_metadata(init: typ.Callable) -> dict[str, ArgMetadata]:
+    params = _parse_docstring_cached(init.__doc__).params if init.__doc__ else {}
+    annotations = _get_annotations_cached(init)
+    # Default values are bound to the last parameters
+    defaults = getattr(init, '__defaults__', None) or ()
+    defaults = (None,) * (len(annotations) - len(defaults)) + defaults
+    return {
+        n: ArgMetadata(type=t, default_value=d, doc=s.replace('\n', ' ') if (s := params.get(n)) else '')
+        for (n, t), d in zip(annotations.items(), defaults)
+    }
+
+
+def _walk_subclasses(cls: type) -> typ.Iterator[type]:
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _walk_subclasses(sub)
+
+
 def _init():
     global _OPERATIONS, _OPS_METADATA
 
-    for k, v in globals().items():
-        if (inspect.isclass(v) and not typing_inspect.is_generic_type(v)
-                and issubclass(v, Operation) and not inspect.isabstract(v)):
-            # noinspection PyTypeChecker
-            op_name = Operation.format_operation_name(k)
+    if _OPERATIONS:  # Already initialized
+        return
+    for v in _walk_subclasses(Operation):
+        # Private classes are base classes that are not meant to be exposed as operations
+        if not v.__name__.startswith('_') and not inspect.isabstract(v):
+            op_name = Operation.format_operation_name(v.__name__)
             _OPERATIONS[op_name] = v
-            docstring = dsp.parse_docstring(v.__init__.__doc__)
-            md_args = {
-                n: ArgMetadata(type=t, default_value=v.__init__.__defaults__[i],
-                               doc=s.replace('\n', ' ') if (s := docstring.params.get(n)) else '')
-                for i, (n, t) in enumerate(inspect.get_annotations(v.__init__).items())
-            }
             _OPS_METADATA[op_name] = OperationMetadata(
                 name=op_name,
-                args=md_args,
                 doc=v.__doc__,
+                init=v.__init__,
             )
 
 
 _init()
 
+_OPS_METADATA_VIEW = types.MappingProxyType(_OPS_METADATA)
+
 
 def get_operations_metadata() -> OperationsMetadada:
-    return _OPS_METADATA.copy()
+    """Returns a read-only view of the metadata of all available operations."""
+    return _OPS_METADATA_VIEW
 
 
 def create_operation(name: str, **kwargs) -> Operation:
@@ -1,11 +1,17 @@
 import abc
+import functools
 import re
 import typing as typ
 
+_UPPERCASE_REGEX = re.compile(r'([A-Z])')
+
 
 class Operation(abc.ABC):
     """An operation is a function that applies a transformation to a string."""
 
+    # Empty to let subclasses declare their own slots
+    __slots__ = ()
+
     @abc.abstractmethod
     def apply(self, s: str) -> str:
         """Applies this operation on the given string.
@@ -28,10 +34,11 @@ class Operation(abc.ABC):
         return f'{op_name}[{args}]'
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def format_operation_name(s: str) -> str:
         """Formats the name of an operation from CamelCase to snake_case.
 
         :param s: The name to format.
         :return: The formatted string.
         """
-        return re.sub(r'([A-Z])', r'_\1', s)[1:].lower()
+        return _UPPERCASE_REGEX.sub(r'_\1', s)[1:].lower()
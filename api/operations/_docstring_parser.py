@@ -4,7 +4,6 @@ Adapted from https://github.com/openstack/rally/blob/master/rally/common/plugin/
 """
 
 import dataclasses
-import math
 import re
 
 _PARAM_OR_RETURNS_REGEX = re.compile(':(?:param|returns)')
@@ -13,30 +12,16 @@ _PARAM_REGEX = re.compile(r':param (?P<name>[*\w]+): (?P<doc>.*?)(?:(?=:param)|(
 
 
 def _trim(docstring: str) -> str:
-    """trim function from PEP-257"""
+    """trim function from PEP-257: computes the minimum indentation, then re-joins the stripped lines"""
     if not docstring:
         return ''
     # Convert tabs to spaces (following the normal Python rules)
     # and split into a list of lines:
     lines = docstring.expandtabs().splitlines()
     # Determine minimum indentation (first line doesn't count):
-    indent = math.inf
-    for line in lines[1:]:
-        stripped = line.lstrip()
-        if stripped:
-            indent = min(indent, len(line) - len(stripped))
-    # Remove indentation (first line is special):
-    trimmed = [lines[0].strip()]
-    if indent < math.inf:
-        for line in lines[1:]:
-            trimmed.append(line[indent:].rstrip())
-    # Strip off trailing and leading blank lines:
-    while trimmed and not trimmed[-1]:
-        trimmed.pop()
-    while trimmed and not trimmed[0]:
-        trimmed.pop(0)
-
-    return '\n'.join(trimmed)
+    indent = min((len(line) - len(stripped) for line in lines[1:] if (stripped := line.lstrip())), default=0)
+    # Remove indentation (first line is special) then strip off trailing and leading blank lines:
+    return '\n'.join([lines[0].strip(), *(line[indent:].rstrip() for line in lines[1:])]).strip('\n')
 
 
 def _reindent(string: str) -> str:
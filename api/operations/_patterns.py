@@ -0,0 +1,51 @@
+"""This module defines the regular expressions used by extractors."""
+import functools
+import re
+
+# Illegal characters: https://stackoverflow.com/a/31976060/3779986
+_UNIX_FP = r'/(?:[^/\0\n\r]+/?)+|(?:[^/\0\n\r]+/)+[^/\0\n\r]*'
+_WINDOWS_FP = \
+    r'[a-zA-Z]:\\(?:[^\\<>:"/|?*\x00-\x1f\n\r]+\\?)+|(?:[^\\<>:"/|?*\x00-\x1f\n\r]+\\)+[^\\<>:"/|?*\x00-\x1f\n\r]*'
+
+_PATTERNS: dict[str, tuple[str, int]] = {
+    'MAC': (r'(?:[a-fA-F\d]{1,2}:){5}[a-fA-F\d]{1,2}', 0),
+    'URL': (r"""\w*://[\w.-]+(?:\.[\w.-]+)+[-\w._~:/?#\[\]@!$&'()*+,;=]+""", 0),
+    # Scheme and network location of a URL, as split by urllib.parse.urlsplit()
+    'URL_NETLOC': (r'[a-zA-Z][a-zA-Z\d]*://([^/?#]*)', 0),
+    # https://www.emailregex.com/
+    'EMAIL': (r"""
+(?:
+     [a-z\d!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z\d!#$%&'*+/=?^_`{|}~-]+)*
+    |"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*"
+)
+@
+(?:
+     (?:[a-z0-9](?:[a-z\d-]*[a-z\d])?\.)+[a-z\d](?:[a-z\d-]*[a-z\d])?
+    |\[(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}
+     (?:
+         25[0-5]
+        |2[0-4]\d
+        |[01]?\d\d?
+        |[a-z\d-]*[a-z\d]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+
+     )]
+)
+""", re.VERBOSE),
+    'UNIX_FP': (_UNIX_FP, 0),
+    'UNIX_FP_NO_WS': (_UNIX_FP.replace(r'\n\r', r'\s'), 0),
+    'WINDOWS_FP': (_WINDOWS_FP, 0),
+    'WINDOWS_FP_NO_WS': (_WINDOWS_FP.replace(r'\n\r', r'\s'), 0),
+    'DATE': (r'\d{4}(?:[-/. ]\d{2}){2}|(?:\d{2}[-/. ]){2}\d{4}', 0),
+}
+
+
+# Patterns are compiled on first use only and kept independently of the re module's own cache
+@functools.lru_cache(maxsize=None)
+def get(name: str) -> re.Pattern[str]:
+    """Return the compiled pattern with the given name.
+
+    :param name: The pattern's name.
+    :return: The compiled pattern.
+    :raise KeyError: If no pattern has the given name.
+    """
+    pattern, flags = _PATTERNS[name]
+    return re.compile(pattern, flags)
@@ -61,12 +61,12 @@ class _Base64Operation(_BaseOperation, abc.ABC):
         super().__init__(encoding=encoding)
         if (size := len(altchars)) != 2:
             raise ValueError(f'altchars must be of length 2, got {size}')
-        self._altchars = bytes(altchars, 'utf8')
+        self._altchars = altchars.encode('ascii')
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
             'encoding': self._encoding,
-            'altchars': self._altchars.decode('utf8'),
+            'altchars': self._altchars.decode('ascii'),
         }
 
 
@@ -90,10 +90,10 @@ class ToBase64(_Base64Operation):
         }
 
     def apply(self, s: str) -> str:
-        data = base64.b64encode(bytes(s, self._encoding), altchars=self._altchars).decode('ascii')
+        data = base64.b64encode(s.encode(self._encoding), altchars=self._altchars)
         if self._remove_pad:
-            data = data.replace('=', '')
-        return data
+            data = data.rstrip(b'=')  # Padding can only appear at the end
+        return data.decode('ascii')
 
 
 class FromBase64(_Base64Operation):
@@ -116,9 +116,10 @@ class FromBase64(_Base64Operation):
         }
 
     def apply(self, s: str) -> str:
-        if self._add_pad and (nb := len(s) % 4):
-            s += '=' * nb
-        return base64.b64decode(bytes(s, 'ascii'), altchars=self._altchars).decode(self._encoding)
+        data = s.encode('ascii')
+        if self._add_pad and (nb := len(data) % 4):
+            data += b'=' * nb
+        return base64.b64decode(data, altchars=self._altchars).decode(self._encoding)
 
 
 class ToBase85(_BaseOperation):
@@ -1,10 +1,56 @@
 import abc
+import functools
+import re
 import typing as typ
 
+import numpy as np
+
 from .. import _core
 from ... import utils
 
 
+@functools.lru_cache(maxsize=None)
+def _build_formatter(base: int, pad: bool, uppercase: bool) -> typ.Callable[[int], str]:
+    """Build a function that formats a single byte in the given base.
+
+    :param base: The base to represent each byte in.
+    :param pad: Whether to pad each byte with 0s.
+    :param uppercase: Whether to put non-numeric digits to uppercase or not.
+    :return: A function that returns the representation of the byte passed to it.
+    """
+    return tuple(utils.format_int(n, base, uppercase=uppercase, pad=-pad) for n in range(256)).__getitem__
+
+
+@functools.lru_cache(maxsize=None)
+def _build_array_table(base: int, uppercase: bool) -> np.ndarray:
+    """Build a table that holds the ASCII codes of the padded representation of each byte in the given base.
+
+    :param base: The base to represent each byte in.
+    :param uppercase: Whether to put non-numeric digits to uppercase or not.
+    :return: A 256×n array, n being the padded length of each byte representation.
+    """
+    digits = ''.join(map(_build_formatter(base, True, uppercase), range(256)))
+    return np.frombuffer(digits.encode('ascii'), dtype=np.uint8).reshape(256, -1)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parsing_table(base: int) -> dict[str, int] | None:
+    """Build a table that maps all padded and unpadded, lower- and uppercase representations
+    of bytes in the given base to their value.
+
+    :param base: The base bytes are represented in.
+    :return: The table or None if the base is not in [2, 36].
+    """
+    if not (2 <= base <= 36):
+        return None
+    table = {}
+    for pad in (False, True):
+        for uppercase in (False, True):
+            format_byte = _build_formatter(base, pad, uppercase)
+            table.update((format_byte(n), n) for n in range(256))
+    return table
+
+
 class _BytewiseOperation(_core.Operation, abc.ABC):
     """Base class for all bytewise numeric transformations."""
 
@@ -16,17 +62,22 @@ class _BytewiseOperation(_core.Operation, abc.ABC):
         """
         self._encoding = encoding
         self._sep = utils.unescape(sep)
-
-    def get_params(self) -> dict[str, typ.Any]:
-        return {
+        # Parameters cannot change after creation, subclasses add theirs in their own constructor
+        self._params = {
             'encoding': self._encoding,
             'sep': self._sep,
         }
 
+    def get_params(self) -> dict[str, typ.Any]:
+        return self._params.copy()
+
 
 class _BytesToBase(_BytewiseOperation):
     """Base class for all operations that convert a string’s bytes to a list of base-n numbers."""
 
+    # Minimum number of bytes above which padded representations are computed with numpy
+    _VECTORIZATION_THRESHOLD = 1024
+
     def __init__(self, encoding: str = 'utf8', uppercase: bool = False, joiner: str = ' ', bpl: int = 0,
                  pad: bool = False, base: int = 10, expose_base: bool = False):
         """Create a to_base operation.
@@ -48,26 +99,55 @@ class _BytesToBase(_BytewiseOperation):
         self._pad = pad
         self._base = base
         self._expose_base = expose_base
-
-    def get_params(self) -> dict[str, typ.Any]:
-        params = {
-            **super().get_params(),
+        self._format_byte = _build_formatter(base, pad, uppercase)
+        self._params.update({
             'pad': self._pad,
             'uppercase': self._uppercase,
             'bpl': self._bytes_per_line,
-        }
+        })
         if self._expose_base:
-            params['base'] = self._base
-        return params
+            self._params['base'] = self._base
 
     def apply(self, s: str) -> str:
-        buffer = [[]]
-        for b in bytearray(s, self._encoding):
-            # noinspection PyChainedComparisons
-            if self._bytes_per_line > 0 and len(buffer[-1]) == self._bytes_per_line:
-                buffer.append([])
-            buffer[-1].append(utils.format_int(b, self._base, uppercase=self._uppercase, pad=-self._pad))
-        return '\n'.join(self._sep.join(line) for line in buffer)
+        return self._format_bytes(s.encode(self._encoding))
+
+    def _format_bytes(self, data: bytes) -> str:
+        """Format the given bytes. Subclasses may override this method to provide faster implementations."""
+        if self._pad and len(data) >= self._VECTORIZATION_THRESHOLD:
+            return self._apply_vectorized(data)
+        tokens = list(map(self._format_byte, data))
+        if (bpl := self._bytes_per_line) <= 0 or len(tokens) <= bpl:
+            return self._sep.join(tokens)
+        # Group full lines at C level by zipping bpl references to the same iterator
+        full_lines_end = len(tokens) - len(tokens) % bpl
+        lines = list(map(self._sep.join, zip(*[iter(tokens[:full_lines_end])] * bpl)))
+        if full_lines_end < len(tokens):
+            lines.append(self._sep.join(tokens[full_lines_end:]))
+        return '\n'.join(lines)
+
+    def _apply_vectorized(self, data: bytes) -> str:
+        # Padded representations all have the same length, they can thus be copied into a 2D array
+        # where each row holds a single byte’s representation followed by the separator
+        table = _build_array_table(self._base, self._uppercase)
+        token_length = table.shape[1]
+        sep = np.frombuffer(self._sep.encode('utf8'), dtype=np.uint8)
+        cell_length = token_length + len(sep)
+        # Lines cannot hold more bytes than the input, this bounds the padded arrays to the input size
+        bpl = min(self._bytes_per_line, len(data)) if self._bytes_per_line > 0 else len(data)
+        lines_nb = -(-len(data) // bpl)
+        # Pad the input so that it fills all lines, extra bytes are sliced off from the result
+        indices = np.zeros(lines_nb * bpl, dtype=np.uint8)
+        indices[:len(data)] = np.frombuffer(data, dtype=np.uint8)
+        cells = np.empty((len(indices), cell_length), dtype=np.uint8)
+        cells[:, :token_length] = table.take(indices, axis=0)  # Faster than fancy indexing
+        cells[:, token_length:] = sep
+        # Replace the trailing separator of each line by a newline
+        line_length = bpl * cell_length - len(sep)
+        out = np.empty((lines_nb, line_length + 1), dtype=np.uint8)
+        out[:, :line_length] = cells.reshape(lines_nb, -1)[:, :line_length]
+        out[:, line_length] = ord('\n')
+        last_line_length = (len(data) - (lines_nb - 1) * bpl) * cell_length - len(sep)
+        return out.tobytes()[:(lines_nb - 1) * (line_length + 1) + last_line_length].decode('utf8')
 
 
 class BytesToBaseN(_BytesToBase):
@@ -105,6 +185,24 @@ class BytesToHex(_BytesToBase):
         """
         super().__init__(encoding=encoding, pad=pad, uppercase=uppercase, joiner=joiner, bpl=bpl, base=16)
 
+    def _format_bytes(self, data: bytes) -> str:
+        if not self._pad:
+            return super()._format_bytes(data)
+        if (bpl := self._bytes_per_line) > 0:
+            if len(data) >= self._VECTORIZATION_THRESHOLD:
+                return self._apply_vectorized(data)
+            return '\n'.join(self._hex(data[i:i + bpl]) for i in range(0, len(data), bpl))
+        return self._hex(data)
+
+    def _hex(self, data: bytes) -> str:
+        sep = self._sep
+        # bytes.hex() only accepts single ASCII char separators, which must not be affected by upper()
+        if len(sep) == 1 and sep.isascii() and sep.upper() == sep.lower():
+            h = data.hex(sep)
+            return h.upper() if self._uppercase else h
+        h = data.hex().upper() if self._uppercase else data.hex()
+        return sep.join([h[i:i + 2] for i in range(0, len(h), 2)]) if sep else h
+
 
 class BytesToOctal(_BytesToBase):
     """Convert a string’s bytes to their octal representation using the specified delimiter."""
@@ -139,6 +237,16 @@ class BytesToBinary(_BytesToBase):
         """
         super().__init__(encoding=encoding, pad=pad, uppercase=uppercase, joiner=joiner, bpl=bpl, base=2)
 
+    def _format_bytes(self, data: bytes) -> str:
+        if not self._pad or self._sep or not data:
+            return super()._format_bytes(data)
+        # Without separator, padded bytes form the binary representation of the data as a single integer
+        bits = format(int.from_bytes(data, 'big'), f'0{8 * len(data)}b')
+        if (bpl := self._bytes_per_line) <= 0:
+            return bits
+        line_length = 8 * bpl
+        return '\n'.join(bits[i:i + line_length] for i in range(0, len(bits), line_length))
+
 
 class _FromBytes(_BytewiseOperation):
     """Base class for all operations that convert a list of base-n bytes into a string."""
@@ -154,17 +262,22 @@ class _FromBytes(_BytewiseOperation):
         super().__init__(encoding=encoding, sep=sep)
         self._base = base
         self._expose_base = expose_base
-
-    def get_params(self) -> dict[str, typ.Any]:
-        params = super().get_params()
+        self._parsing_table = _build_parsing_table(base)
         if self._expose_base:
-            params['base'] = self._base
-        return params
+            self._params['base'] = self._base
 
     def apply(self, s: str) -> str:
-        if self._sep != '\n':
-            s = s.replace('\n', self._sep)
-        return bytes(int(h, self._base) for h in filter(None, s.split(self._sep))).decode(self._encoding)
+        # Newlines are treated as separators too, replace() + split() is faster than a regex split
+        tokens = [t for t in s.replace('\n', self._sep).split(self._sep) if t]
+        return self._to_bytes(tokens).decode(self._encoding)
+
+    def _to_bytes(self, tokens: list[str]) -> bytes:
+        if self._parsing_table:
+            try:
+                return bytes(map(self._parsing_table.__getitem__, tokens))
+            except KeyError:
+                pass  # Let int() deal with non-standard representations
+        return bytes(int(h, self._base) for h in tokens)
 
 
 class FromBaseNBytes(_FromBytes):
@@ -190,6 +303,41 @@ class FromHexBytes(_FromBytes):
         :param sep: String to use to split each byte representation.
         """
         super().__init__(encoding=encoding, sep=sep, base=16)
+        # bytes.fromhex() skips whitespace, input split on a single whitespace character can thus be decoded directly
+        if len(self._sep) == 1 and self._sep.isascii() and self._sep.isspace():
+            self._long_token_regex = re.compile(f'[^{re.escape(self._sep)}\n]{{3}}')
+        else:
+            self._long_token_regex = None
+
+    def apply(self, s: str) -> str:
+        if not self._sep:
+            # Without separator, each pair of digits is a byte
+            return bytes.fromhex(s).decode(self._encoding)
+        if self._long_token_regex:
+            try:
+                data = bytes.fromhex(s)
+            except ValueError:
+                pass
+            else:
+                separators = s.count(self._sep) if self._sep == '\n' else s.count(self._sep) + s.count('\n')
+                # Make sure that only separators were skipped and that no token represents more than one byte
+                if 2 * len(data) + separators == len(s) and not self._long_token_regex.search(s):
+                    return data.decode(self._encoding)
+        return super().apply(s)
+
+    def _to_bytes(self, tokens: list[str]) -> bytes:
+        hex_string = ' '.join(tokens)
+        # Fast path when each byte is represented by exactly 2 hex digits
+        if len(hex_string) == 3 * len(tokens) - 1:
+            try:
+                data = bytes.fromhex(hex_string)
+            except ValueError:
+                pass
+            else:
+                # Whitespace-only tokens are skipped by bytes.fromhex()
+                if len(data) == len(tokens):
+                    return data
+        return super()._to_bytes(tokens)
 
 
 class FromOctalBytes(_FromBytes):
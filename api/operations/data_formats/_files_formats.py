@@ -1,6 +1,8 @@
 import abc
 import csv
+import functools
 import io
+import itertools
 import json
 import re
 import typing as typ
@@ -10,6 +12,15 @@ import avro.io as avro_io
 
 from .. import _core
 
+_FLOAT_REGEX = re.compile(r'\d*\.\d+|\d+\.\d*')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dialect(sep: str, quote: str) -> type[csv.Dialect]:
+    """Return a CSV dialect for the given separator and quoting character.
+    Other formatting options are those of the default 'excel' dialect."""
+    return type('_Dialect', (csv.excel,), {'delimiter': sep, 'quotechar': quote})
+
 
 class _CsvJson(_core.Operation, abc.ABC):
     """Base class for CSV/JSON operations."""
@@ -22,13 +33,16 @@ class _CsvJson(_core.Operation, abc.ABC):
         """
         self._value_sep = sep
         self._quote = quote
-
-    def get_params(self) -> dict[str, typ.Any]:
-        return {
+        self._dialect = _get_dialect(sep, quote)
+        # Parameters cannot change after creation, subclasses add theirs in their own constructor
+        self._params = {
             'value_sep': self._value_sep,
             'quote': self._quote,
         }
 
+    def get_params(self) -> dict[str, typ.Any]:
+        return self._params.copy()
+
 
 class CsvToJson(_CsvJson):
     """Convert a CSV file into JSON."""
@@ -53,101 +67,82 @@ class CsvToJson(_CsvJson):
         self._mode = mode
         self._parse_values = parse_values
         self._strict = strict
-
-    def get_params(self) -> dict[str, typ.Any]:
-        return {
-            **super().get_params(),
+        self._params.update({
             'mode': self._mode,
             'parse_values': self._parse_values,
             'strict': self._strict,
-        }
+        })
 
     def apply(self, s: str) -> str:
         with io.StringIO(s) as f:
-            parsed_csv = csv.DictReader(f, delimiter=self._value_sep, quotechar=self._quote)
+            reader = csv.reader(f, dialect=self._dialect)
+            header = next(reader, [])
+            # Rows are streamed from the reader, skipping empty lines like csv.DictReader does
+            rows = (row for row in reader if row)
             objects = None
             match self._mode:
                 case self.ARRAYS:
-                    objects = self._to_arrays(parsed_csv)
+                    objects = self._to_arrays(header, rows)
                 case self.DICTS:
-                    objects = self._to_dicts(parsed_csv)
+                    objects = self._to_dicts(header, rows)
                 case self.DICT_OF_ARRAYS:
-                    objects = self._to_dict_of_arrays(parsed_csv)
-            return json.dumps(objects)
+                    objects = self._to_dict_of_arrays(header, rows)
+        return json.dumps(objects)
 
-    def _to_arrays(self, lines: csv.DictReader) -> list[list[str]]:
-        if not lines.fieldnames:
+    def _to_arrays(self, header: list[str], rows: typ.Iterable[list[str]]) -> list[list[str]]:
+        if not header:
             return []
-        data = [[self._parse_value(v) for v in lines.fieldnames]] if self._parse_values else [lines.fieldnames]
-        for i, line in enumerate(lines):
-            data.append([])
-            for v in line.values():
-                if isinstance(v, list):
-                    data[-1].extend(map(self._parse_value, v))
-                else:
-                    data[-1].append(self._parse_value(v))
-            if self._strict and (len1 := len(lines.fieldnames)) != (len2 := len(data[-1])):
-                self._error(len1, len2, i)
-        return data
-
-    def _to_dicts(self, lines: csv.DictReader) -> list[dict[str, str]]:
-        if not lines.fieldnames:
-            return []
-        header = lines.fieldnames
-        if '' in header:
-            raise ValueError('empty column name')
-        if len(set(header)) != len(header):
-            raise ValueError('duplicate column name')
-
-        data = []
-        for i, line in enumerate(lines):
-            header_size = len(header)
-            row_size = len(line)
-            if self._strict and None in line:
-                self._error(header_size, row_size + len(line[None]), i)
-            data.append({k: self._parse_value(v) for k, v in line.items() if k is not None})
+        if not self._parse_values:
+            return [header, *self._pad_rows(header, rows)]
+        parse = self._parse_value
+        return [list(map(parse, header)), *(list(map(parse, row)) for row in self._pad_rows(header, rows))]
 
-        return data
+    def _to_dicts(self, header: list[str], rows: typ.Iterable[list[str]]) -> list[dict[str, str]]:
+        if not header:
+            return []
+        self._check_header(header)
+        if not self._parse_values:
+            return [dict(zip(header, row)) for row in self._pad_rows(header, rows)]
+        return [dict(zip(header, map(self._parse_value, row))) for row in self._pad_rows(header, rows)]
 
-    def _to_dict_of_arrays(self, lines: csv.DictReader) -> dict[str, list[str]]:
-        if not lines.fieldnames:
+    def _to_dict_of_arrays(self, header: list[str], rows: typ.Iterable[list[str]]) -> dict[str, list[str]]:
+        if not header:
             return {}
-        header = lines.fieldnames
+        self._check_header(header)
+        # Transpose rows into columns, extra values are dropped by zip()
+        columns = list(zip(*self._pad_rows(header, rows))) or [()] * len(header)
+        if not self._parse_values:
+            return {k: list(column) for k, column in zip(header, columns)}
+        return {k: list(map(self._parse_value, column)) for k, column in zip(header, columns)}
+
+    @staticmethod
+    def _check_header(header: list[str]):
         if '' in header:
             raise ValueError('empty column name')
         if len(set(header)) != len(header):
             raise ValueError('duplicate column name')
 
-        data = {k: [] for k in lines.fieldnames}
-        for i, line in enumerate(lines):
-            header_size = len(header)
-            row_size = len(line)
-            if self._strict and None in line:
-                self._error(header_size, row_size + len(line[None]), i)
-            for k, v in line.items():
-                if k is not None:
-                    data[k].append(self._parse_value(v))
-
-        return data
-
-    _FLOAT_REGEX = re.compile(r'\d*\.\d+|\d+\.\d*')
-
-    def _parse_value(self, value: str | None) -> str | int | float | bool | None:
-        if not self._parse_values:
-            return value or ''  # Replace None by ''
-        match value:
-            case None | '':
-                return None
-            case 'true':
-                return True
-            case 'false':
-                return False
-            case v if v.isascii() and v.isnumeric():
-                return int(v)
-            case v if self._FLOAT_REGEX.fullmatch(v):
-                return float(v)
-            case v:
-                return v
+    def _pad_rows(self, header: list[str], rows: typ.Iterable[list[str]]) -> typ.Iterator[list[str]]:
+        """Pad in-place rows that are shorter than the header with empty values.
+        In strict mode, an error is raised for rows that are longer than the header."""
+        header_size = len(header)
+        for i, row in enumerate(rows):
+            if (row_size := len(row)) < header_size:
+                row.extend([''] * (header_size - row_size))
+            elif self._strict and row_size > header_size:
+                self._error(header_size, row_size, i)
+            yield row
+
+    _CONSTANTS = {'': None, 'true': True, 'false': False}
+
+    def _parse_value(self, value: str) -> str | int | float | bool | None:
+        if value in self._CONSTANTS:
+            return self._CONSTANTS[value]
+        if value.isascii() and value.isdigit():
+            return int(value)
+        if _FLOAT_REGEX.fullmatch(value):
+            return float(value)
+        return value
 
     def _error(self, expected_len: int, actual_len: int, index: int):
         raise ValueError(f'row #{index + 2} has length {actual_len}, expected {expected_len}')
@@ -173,55 +168,73 @@ class JsonToCsv(_CsvJson):
                 raise ValueError('invalid JSON format')
         # Convert to CSV
         with io.StringIO() as file:
-            writer = csv.DictWriter(file, fieldnames=header, delimiter=self._value_sep, quotechar=self._quote)
-            writer.writeheader()
+            writer = csv.writer(file, dialect=self._dialect)
+            writer.writerow(header)
             writer.writerows(data)
             return file.getvalue().strip()
 
     @staticmethod
     def _detect_json_format(o: dict | list) -> str | None:
+        # Only the first element is inspected, others are checked while being converted
         if isinstance(o, list):
-            if all(isinstance(e, list) for e in o):
+            if isinstance(o[0], list):
                 return CsvToJson.ARRAYS
-            if all(isinstance(e, dict) for e in o):
+            if isinstance(o[0], dict):
                 return CsvToJson.DICTS
-        if isinstance(o, dict) and all(isinstance(k, str) and isinstance(v, list) for k, v in o.items()):
+        if isinstance(o, dict) and isinstance(next(iter(o.values())), list):
             return CsvToJson.DICT_OF_ARRAYS
         return None
 
+    @staticmethod
+    def _check_type(o, type_: type):
+        if not isinstance(o, type_):
+            raise ValueError('invalid JSON format')
+
     @staticmethod
     def _bool_to_str(v):
-        return str(v).lower() if isinstance(v, bool) else v
+        # Identity checks as 1 == True and 0 == False
+        return 'true' if v is True else 'false' if v is False else v
 
-    def _from_arrays(self, json_object: list[list[str]]) -> tuple[list[str], list[dict[str, str]]]:
+    def _from_arrays(self, json_object: list[list[str]]) -> tuple[list[str], list[list[str]]]:
         header = json_object[0]
+        header_size = len(header)
+        # Local bindings avoid repeated attribute lookups in the loop
+        check_type = self._check_type
+        bool_to_str = self._bool_to_str
         data = []
+        append = data.append
         for row in json_object[1:]:
-            if len(row) < len(header):
+            check_type(row, list)
+            values = list(map(bool_to_str, row[:header_size]))
+            if len(values) < header_size:
                 # Pad lines with not enough values
-                row.extend([''] * (len(header) - len(row)))
-            data.append(dict(zip(header, map(self._bool_to_str, row))))
+                values.extend([''] * (header_size - len(values)))
+            append(values)
         return header, data
 
-    def _from_dicts(self, json_object: list[dict[str, str]]) -> tuple[list[str], list[dict[str, str]]]:
+    def _from_dicts(self, json_object: list[dict[str, str]]) -> tuple[list[str], list[list[str]]]:
         header = []
-        data = []
+        seen_keys = set()
+        check_type = self._check_type
+        bool_to_str = self._bool_to_str
+        add_key = seen_keys.add
+        append_key = header.append
         for entry in json_object:
-            data.append({})
-            for k, v in entry.items():
-                if k not in header:
-                    header.append(k)
-                data[-1][k] = self._bool_to_str(v)
+            check_type(entry, dict)
+            for k in entry:
+                if k not in seen_keys:
+                    add_key(k)
+                    append_key(k)
+        data = [[bool_to_str(entry.get(k, '')) for k in header] for entry in json_object]
         return header, data
 
-    def _from_dict_of_dicts(self, json_object: dict[str, list[str]]) -> tuple[list[str], list[dict[str, str]]]:
+    def _from_dict_of_dicts(self, json_object: dict[str, list[str]]) -> tuple[list[str], list[list[str]]]:
         header = list(json_object.keys())
-        data = []
-        for k, values in json_object.items():
-            for i, v in enumerate(values):
-                if i == len(data):
-                    data.append({})
-                data[i][k] = self._bool_to_str(v)
+        for values in json_object.values():
+            self._check_type(values, list)
+        # Transpose columns into rows, padding shorter columns
+        bool_to_str = self._bool_to_str
+        data = [list(map(bool_to_str, row)) for row in itertools.zip_longest(*json_object.values(), fillvalue='')]
         return header, data
 
 
@@ -1,5 +1,7 @@
 import csv
+import functools
 import io
+import itertools
 import re
 import typing as typ
 import unicodedata
@@ -7,43 +9,98 @@ import unicodedata
 from .. import _core
 
 
+class _QuoteTable(dict):
+    """str.translate() table that maps characters to their Quoted Printable representation.
+    ASCII characters are left unchanged, others are replaced by their UTF-8 bytes and cached on first use."""
+
+    def __missing__(self, key: int) -> str:
+        self[key] = value = ''.join(f'={b:02X}' for b in chr(key).encode('utf8'))
+        return value
+
+
+_QUOTE_TABLE = _QuoteTable({i: chr(i) for i in range(128)})
+
+
 class ToQuotedPrintable(_core.Operation):
     """Encode UTF-8 text as Quoted Printable text."""
 
     _MAX_LENGTH = 76
 
     def apply(self, s: str) -> str:
+        width = self._MAX_LENGTH - 1  # Keep room for the soft line break
         lines = []
         for line in s.split('\n'):
-            buffer = ''
+            if line.isascii():
+                # Each character is a single token, the line can be cut at fixed positions
+                full_lines_end = len(line) - len(line) % width
+                lines.extend(line[i:i + width] + '=' for i in range(0, full_lines_end, width))
+                if full_lines_end < len(line):
+                    lines.append(line[full_lines_end:])
+                continue
+            if '=' not in line:
+                # All '=' are token starts, the encoded line can be cut without splitting a token or character
+                line = line.translate(_QUOTE_TABLE)
+                start = 0
+                end = len(line)
+                while end - start >= width:
+                    cut = start + width
+                    if line[cut - 1] == '=':
+                        cut -= 1
+                    elif line[cut - 2] == '=':
+                        cut -= 2
+                    # Tokens of UTF-8 continuation bytes cannot start a line
+                    while cut < end and line[cut] == '=' and line[cut + 1] in '89AB':
+                        cut -= 3
+                    lines.append(line[start:cut] + '=')
+                    start = cut
+                if start < end:
+                    lines.append(line[start:])
+                continue
+            buffer = []
+            buffer_length = 0
             for c in line:
-                if c.isascii():
-                    char = c
-                else:
-                    char = ''.join((f'={b:02X}' for b in bytes(c, 'utf8')))
-                if len(buffer + char) == self._MAX_LENGTH - 1:
-                    lines.append(buffer + char + '=')
-                    buffer = ''
-                elif len(buffer + char) > self._MAX_LENGTH - 1:
-                    lines.append(buffer + '=')
-                    buffer = char
+                char = _QUOTE_TABLE[ord(c)]
+                if (new_length := buffer_length + len(char)) == width:
+                    buffer.append(char)
+                    lines.append(''.join(buffer) + '=')
+                    buffer = []
+                    buffer_length = 0
+                elif new_length > width:
+                    lines.append(''.join(buffer) + '=')
+                    buffer = [char]
+                    buffer_length = len(char)
                 else:
-                    buffer += char
+                    buffer.append(char)
+                    buffer_length = new_length
             if buffer:
-                lines.append(buffer)
+                lines.append(''.join(buffer))
         return '\n'.join(lines)
 
 
 class FromQuotedPrintable(_core.Operation):
     """Decode Quoted Printable text into UTF-8."""
 
-    _BYTES_REGEX = re.compile(r'(=[\da-fA-F]{2})+')
+    # Soft line breaks are matched along with encoded bytes, a byte sequence may be split across lines
+    _BYTES_REGEX = re.compile(r'(?:=\n|=[\da-fA-F]{2})+')
 
     def apply(self, s: str) -> str:
-        def decode(m: re.Match) -> str:
-            return b''.join(int(c, 16).to_bytes(1, 'big') for c in m.group(0)[1:].split('=')).decode('utf8')
+        return self._BYTES_REGEX.sub(self._decode, s)
 
-        return self._BYTES_REGEX.sub(decode, s.replace('=\n', ''))
+    @staticmethod
+    def _decode(m: re.Match) -> str:
+        return bytes.fromhex(m.group(0).replace('=\n', '').replace('=', '')).decode('utf8')
+
+
+@functools.lru_cache(maxsize=None)
+def _build_hex_dump_table(unix: bool) -> bytes:
+    """Build a bytes.translate() table that replaces bytes of unprintable latin1 characters by a dot.
+
+    :param unix: Whether only ASCII characters should be considered printable.
+    :return: The translation table.
+    """
+    # UNIX mode only prints ASCII characters
+    # Don’t print control characters
+    return bytes(ord('.') if unix and b > 127 or unicodedata.category(chr(b))[0] == 'C' else b for b in range(256))
 
 
 class ToHexDump(_core.Operation):
@@ -76,31 +133,24 @@ class ToHexDump(_core.Operation):
         if length > 0xffffffff:
             raise OverflowError('too many bytes')
         x = 'X' if self._uppercase else 'x'
-        lines = []
-        for i in range(0, length, self._bpl):
-            chunk_data = data[i:i + self._bpl]
-            chunk_bytes = ' '.join(format(b, '02' + x) for b in chunk_data)
-            if len(chunk_data) < self._bpl:
-                # Pad last line with spaces on the end
-                chunk_bytes += ' ' * ((3 * self._bpl - 1) - (3 * len(chunk_data) - 1))
-            chunk_text = ''.join(self._decode(b) for b in chunk_data)
-            lines.append(f'{format(i, "08" + x)}  {chunk_bytes}  |{chunk_text}|')
+        bpl = self._bpl
+        # Bytes are decoded as latin1 to map each one to a single character of the text column
+        text = data.translate(_build_hex_dump_table(self._unix)).decode('latin1')
+        # Hex representations are computed at once, each byte taking 3 characters with its separator
+        hex_bytes = data.hex(' ')
+        if self._uppercase:
+            hex_bytes = hex_bytes.upper()
+        bytes_width = 3 * bpl - 1  # Pad last line with spaces on the end
+        lines = [f'{i:08{x}}  {hex_bytes[3 * i:3 * i + bytes_width]:<{bytes_width}}  |{text[i:i + bpl]}|'
+                 for i in range(0, length, bpl)]
         lines.append(format(length, '08' + x))
         return '\n'.join(lines)
 
-    def _decode(self, b: int) -> str:
-        c = chr(b)
-        # UNIX mode only prints ASCII characters
-        # Don’t print control characters
-        if self._unix and b > 127 or unicodedata.category(c)[0] == 'C':
-            return '.'
-        return c
-
 
 class FromHexDump(_core.Operation):
     """Convert a hexdump into text."""
 
-    _LINE_REGEX = re.compile(r'^[\da-fA-F]+[ \t]+((?:[\da-fA-F]{2}[ \t]+)+)[ \t]+\|.+\|$')
+    _LINE_REGEX = re.compile(r'^[\da-fA-F]+[ \t]+((?:[\da-fA-F]{2}[ \t]+)+)[ \t]+\|.+\|$', re.MULTILINE)
 
     def __init__(self, encoding: str = 'utf8'):
         """Create a from_hex_dump operation.
@@ -115,11 +165,11 @@ class FromHexDump(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        data = b''
-        for i, line in enumerate(s.split('\n')):
-            raw_bytes = self._LINE_REGEX.fullmatch(line)
-            if raw_bytes is not None:
-                data += bytes(int(b, 16) for b in filter(None, raw_bytes.group(1).split(' ')))
+        data = bytearray()
+        # Lines are matched in a single scan, non-matching ones are skipped
+        for raw_bytes in self._LINE_REGEX.finditer(s):
+            # bytes.fromhex() skips whitespace between bytes
+            data.extend(bytes.fromhex(raw_bytes.group(1)))
         return data.decode(self._encoding)
 
 
@@ -149,54 +199,48 @@ class ToTable(_core.Operation):
 
     def apply(self, s: str) -> str:
         with io.StringIO(s) as f:
-            csv_data = csv.DictReader(f, delimiter=self._value_sep, quotechar=self._quote)
-            lines = [csv_data.fieldnames, *map(self._parse_line, csv_data)]
+            reader = csv.reader(f, delimiter=self._value_sep, quotechar=self._quote)
+            header = next(reader, None)
+            rows = (row for row in reader if row)  # Skip empty rows
+            if header is not None and len(set(header)) != len(header):
+                lines = [header, *(self._merge_duplicate_columns(header, row) for row in rows)]
+            else:
+                # Pad shorter rows, values of longer rows are all kept
+                header_size = len(header or ())
+                lines = [header, *(row + [''] * (header_size - len(row)) for row in rows)]
         if self._as_html:
             return self._html(lines)
         return self._ascii(lines)
 
     @staticmethod
-    def _parse_line(line_dict: dict[str, str | list[str | None] | None]) -> list[str]:
-        def parse(line: str | typ.Iterable[str | None] | None) -> list[str]:
-            values = []
-            for v in line:
-                match v:
-                    case None:
-                        values.append('')
-                    case [*l]:  # csv.DictReader puts additional column values into a list
-                        values.extend(parse(l))
-                    case v:
-                        values.append(v)
-            return values
-
-        return parse(line_dict.values())
+    def _merge_duplicate_columns(header: list[str], row: list[str]) -> list[str]:
+        """Keep only the last value of each duplicate column, the missing ones being replaced by empty values.
+        Additional values are kept as-is at the end of the row."""
+        values = dict(zip(header, row))
+        for k in header[len(row):]:
+            values[k] = ''
+        return [*values.values(), *row[len(header):]]
 
     def _html(self, lines: list[list[str]]) -> str:
-        res = '<table>\n<tbody>\n'
+        res = ['<table>\n<tbody>\n']
         for i, line in enumerate(lines):
             cell_type = 'th' if self._has_header and i == 0 else 'td'
-            res += '<tr>\n' + ''.join(f'  <{cell_type}>{v}</{cell_type}>\n' for v in line) + '</tr>\n'
-        return res + '</tbody>\n</table>'
+            res.append('<tr>\n')
+            res.extend(f'  <{cell_type}>{v}</{cell_type}>\n' for v in line)
+            res.append('</tr>\n')
+        res.append('</tbody>\n</table>')
+        return ''.join(res)
 
     def _ascii(self, lines: list[list[str]]) -> str:
-        column_widths = []
-        # Compute width of each column
-        for line in lines:
-            for i, v in enumerate(line):
-                if i == len(column_widths):
-                    column_widths.append(0)
-                if (cell_length := len(v)) > column_widths[i]:
-                    column_widths[i] = cell_length
-
-        row_sep = '+' + '+'.join('-' * (2 + w) for w in column_widths) + '+\n'
-        res = row_sep
+        # Compute width of each column, shorter lines are padded with empty cells
+        columns = itertools.zip_longest(*lines, fillvalue='')
+        column_widths = [max(map(len, column)) for column in columns]
+
+        row_sep = '+' + '+'.join('-' * (2 + w) for w in column_widths) + '+'
+        res = [row_sep]
         for i, line in enumerate(lines):
-            table_line = '|'
-            for j, w in enumerate(column_widths):
-                v = line[j] if j < len(line) else ''
-                v += ' ' * (w - len(v))
-                table_line += f' {v} |'
-            res += table_line + '\n'
+            res.append('|' + ''.join(f' {v.ljust(w)} |'
+                                     for v, w in itertools.zip_longest(line, column_widths, fillvalue='')))
             if self._has_header and i == 0 or i == len(lines) - 1:
-                res += row_sep
-        return res[:-1]  # Remove trailing \n
+                res.append(row_sep)
+        return '\n'.join(res)
@@ -1,6 +1,9 @@
 import abc
+import calendar
 import datetime as dt
-import math
+import functools
+import operator
+import re
 import time
 import typing as typ
 
@@ -28,6 +31,7 @@ class GetTime(_core.Operation):
         if unit not in self._UNITS:
             raise ValueError(f'invalid granularity: {unit}')
         self._unit = unit
+        self._divisor = self._UNITS[unit]
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -35,7 +39,7 @@ class GetTime(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        return str(time.time_ns() // self._UNITS[self._unit])
+        return str(time.time_ns() // self._divisor)
 
 
 class FromUnixTs(_core.Operation):
@@ -43,9 +47,9 @@ class FromUnixTs(_core.Operation):
 
     UNITS = {
         's': 1,
-        'ms': 1e3,
-        'µs': 1e6,
-        'ns': 1e9,
+        'ms': 1_000,
+        'µs': 1_000_000,
+        'ns': 1_000_000_000,
     }
 
     def __init__(self, tz: str = 'UTC', unit: str = 's'):
@@ -58,6 +62,7 @@ class FromUnixTs(_core.Operation):
             raise ValueError(f'invalid unit: {unit!r}')
         self._tz = tz or 'UTC'
         self._unit = unit
+        self._divisor = self.UNITS[unit]
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -66,13 +71,31 @@ class FromUnixTs(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        return str(dt.datetime.fromtimestamp(float(s) / self.UNITS[self._unit],
-                                             tz=_tz(self._tz) if self._tz else None))
+        tz = _tz(self._tz) if self._tz else None
+        try:
+            timestamp = int(s)
+        except ValueError:
+            return str(dt.datetime.fromtimestamp(float(s) / self._divisor, tz=tz))
+        # Integer timestamps are converted without floats as they cannot represent µs and ns timestamps precisely
+        microseconds, remainder = divmod(timestamp * 1_000_000, self._divisor)
+        # Round half to even, like datetime.fromtimestamp()
+        if 2 * remainder > self._divisor or 2 * remainder == self._divisor and microseconds % 2:
+            microseconds += 1
+        seconds, microseconds = divmod(microseconds, 1_000_000)
+        return str(dt.datetime.fromtimestamp(seconds, tz=tz).replace(microsecond=microseconds))
 
 
 class _ParseDatetime(_core.Operation, abc.ABC):
     """Base class for operations that parse dates."""
 
+    # ISO 8601 formats that datetime.fromisoformat() parses much faster than strptime(),
+    # associated to the pattern inputs have to match to be parsed the same way by both functions
+    _ISO_FORMATS = {
+        '%Y-%m-%d': re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII),
+        '%Y-%m-%d %H:%M:%S': re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', re.ASCII),
+        '%Y-%m-%dT%H:%M:%S': re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', re.ASCII),
+    }
+
     # noinspection PyShadowingBuiltins
     def __init__(self, format: str = '%Y-%m-%d', tz: str = 'UTC'):
         """Create a date-parsing operation.
@@ -82,6 +105,7 @@ class _ParseDatetime(_core.Operation, abc.ABC):
         """
         self._format = format or 'UTC'
         self._tz = tz
+        self._iso_regex = self._ISO_FORMATS.get(self._format)
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -90,6 +114,11 @@ class _ParseDatetime(_core.Operation, abc.ABC):
         }
 
     def _parse(self, s: str) -> dt.datetime:
+        if self._iso_regex and self._iso_regex.fullmatch(s):
+            try:
+                return dt.datetime.fromisoformat(s).replace(tzinfo=_tz(self._tz))
+            except ValueError:
+                pass  # Let strptime() raise its own error
         return dt.datetime.strptime(s, self._format).replace(tzinfo=_tz(self._tz))
 
 
@@ -123,40 +152,48 @@ class ToUnixTs(_ParseDatetime):
 class ParseDatetime(_ParseDatetime):
     """Parse a date-time string."""
 
+    # Number of days in each month of non-leap years, indexed by month number
+    _DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
     def apply(self, s: str) -> str:
         date = self._parse(s)
-        leap_year = date.year % 4 == 0 and date.year % 100 != 0 or date.year % 400 == 0
+        leap_year = calendar.isleap(date.year)
+        days_in_month = self._DAYS_IN_MONTH[date.month] + (leap_year and date.month == 2)
+        # All strftime() fields are formatted at once
+        full_date, time_, period, utc_offset, week = date.strftime('%A %d %B %Y\n%H:%M:%S\n%p\n%z\n%U').split('\n')
         return f"""\
-Date: {date.strftime('%A %d %B %Y')}
-Time: {date.strftime('%H:%M:%S')}
-Period: {date.strftime('%p')}
+Date: {full_date}
+Time: {time_}
+Period: {period}
 Timezone: {date.tzname() or 'N/A'}
-UTC offset: {date.strftime('%z')}
+UTC offset: {utc_offset}
 
 Leap year: {str(leap_year).lower()}
-Days in month: {self._days_in_month(date.month, leap_year)}
+Days in month: {days_in_month}
 
 Day of year: {date.timetuple().tm_yday}
-Week number: {date.strftime('%U')}
-Trimester: {math.ceil(date.month / 3)}
+Week number: {week}
+Trimester: {(date.month + 2) // 3}
 """
 
-    @staticmethod
-    def _days_in_month(month: int, leap_year: bool):
-        match month:
-            case 1 | 3 | 5 | 7 | 8 | 10 | 12:
-                return 31
-            case 2 | 4 | 6 | 9 | 11:
-                return 30
-            case _ if leap_year:
-                return 29
-            case _:
-                return 28
-
 
 class ConvertDatetime(_ParseDatetime):
     """Convert a date-time representation into another."""
 
+    _DIRECTIVE_REGEX = re.compile(r'%(.)', re.DOTALL)
+    # Platform-independent strftime() directives that can be rendered with printf-style formatting,
+    # associated to their conversion specifier and the datetime attribute they format
+    _DIRECTIVES = {
+        'Y': ('%04d', 'year'),  # Only valid for years ≥ 1000 as some platforms do not pad years
+        'm': ('%02d', 'month'),
+        'd': ('%02d', 'day'),
+        'H': ('%02d', 'hour'),
+        'M': ('%02d', 'minute'),
+        'S': ('%02d', 'second'),
+        'f': ('%06d', 'microsecond'),
+        '%': ('%%', None),
+    }
+
     # noinspection PyShadowingBuiltins
     def __init__(self, in_format: str = '%Y-%m-%d', in_tz: str = 'UTC',
                  out_format: str = '%Y-%m-%d', out_tz: str = 'UTC'):
@@ -170,6 +207,7 @@ class ConvertDatetime(_ParseDatetime):
         super().__init__(format=in_format, tz=in_tz)
         self._out_format = out_format
         self._out_tz = out_tz
+        self._out_template = self._to_printf_template(out_format)
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -181,9 +219,41 @@ class ConvertDatetime(_ParseDatetime):
 
     def apply(self, s: str) -> str:
         date = self._parse(s).astimezone(tz=_tz(self._out_tz))
+        if self._out_template is not None and date.year >= 1000:
+            template, get_fields = self._out_template
+            return template % get_fields(date)
         return date.strftime(self._out_format)
 
+    @classmethod
+    def _to_printf_template(cls, date_format: str) -> tuple[str, typ.Callable[[dt.datetime], typ.Any]] | None:
+        """Convert a strftime() format into an equivalent printf-style template.
 
+        :param date_format: The format to convert.
+        :return: The template and a function that returns the values to format,
+         or None if the format contains directives that are not supported.
+        """
+        if '\0' in date_format:
+            return None
+        parts = []
+        fields = []
+        i = 0
+        for m in cls._DIRECTIVE_REGEX.finditer(date_format):
+            if (directive := cls._DIRECTIVES.get(m.group(1))) is None:
+                return None
+            specifier, field = directive
+            parts.append(date_format[i:m.start()].replace('%', '%%'))
+            parts.append(specifier)
+            if field:
+                fields.append(field)
+            i = m.end()
+        if '%' in (end := date_format[i:]):  # Trailing lone %
+            return None
+        parts.append(end)
+        # attrgetter() returns a single value instead of a tuple for one field, which % accepts as well
+        return ''.join(parts), operator.attrgetter(*fields) if fields else lambda _: ()
+
+
+@functools.lru_cache(maxsize=None)
 def _tz(tzname: str) -> dt.tzinfo:
     """Create a tzinfo object for the given timezone name.
 
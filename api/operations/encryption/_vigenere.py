@@ -1,5 +1,7 @@
 import typing as typ
 
+import numpy as np
+
 from .. import _core
 
 
@@ -7,6 +9,8 @@ class Vigenere(_core.Operation):
     """Encode/decode a text using Vigenère cypher."""
 
     _ENCODE = 'encode'
+    # Minimum number of characters above which ASCII texts are processed with numpy
+    _VECTORIZATION_THRESHOLD = 1024
 
     def __init__(self, key: str = '', mode: str = _ENCODE):
         """Create a Vigenère cypher operation.
@@ -18,6 +22,27 @@ class Vigenere(_core.Operation):
             raise ValueError(f'invalid mode {mode!r}')
         self._key = key
         self._mode = mode
+        # Precomputed substitutions, only available if each key character has a single-character uppercase
+        upper_key = key.upper()
+        if key and len(upper_key) == len(key):
+            self._key_codes = np.array([ord(c) for c in upper_key], dtype=np.int64)
+            self._substitution_tables = [self._build_substitution_table(ord(c)) for c in upper_key]
+        else:
+            self._key_codes = None
+            self._substitution_tables = None
+
+    def _build_substitution_table(self, key_code: int) -> tuple[str, str]:
+        """Build the substitution alphabets for the given key character code.
+
+        :param key_code: The code of the uppercase key character.
+        :return: The substituted uppercase and lowercase alphabets.
+        """
+        # 65 = ord('A')
+        if self._mode == self._ENCODE:
+            upper = ''.join(chr((c + key_code - 2 * 65) % 26 + 65) for c in range(65, 91))
+        else:
+            upper = ''.join(chr((c - key_code) % 26 + 65) for c in range(65, 91))
+        return upper, upper.lower()
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -26,22 +51,61 @@ class Vigenere(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        key_length = len(self._key)
-        res = ''
+        if self._substitution_tables is None:
+            return self._apply_generic(s)
+        if len(s) >= self._VECTORIZATION_THRESHOLD and s.isascii():
+            return self._apply_ascii(s)
+        tables = self._substitution_tables
+        key_length = len(tables)
+        res = []
+        append = res.append
+        i = 0
+        for c in s:
+            if 'A' <= (char := c.upper()) <= 'Z':
+                upper, lower = tables[i]
+                append(upper[ord(char) - 65] if c.isupper() else lower[ord(char) - 65])
+                i = (i + 1) % key_length
+            else:
+                append(c)
+        return ''.join(res)
+
+    def _apply_generic(self, s: str) -> str:
+        # Keys that cannot be tabulated still work on texts with fewer letters than their first invalid index
+        key = self._key
+        key_length = len(key)
+        encode = self._mode == self._ENCODE
+        res = []
+        append = res.append
         i = 0
         for c in s:
             if 'A' <= (char := c.upper()) <= 'Z':
-                key_char = self._key[i]
-                cc = self._table(char, key_char.upper())
-                res += cc if c.isupper() else cc.lower()
+                key_char = key[i]
+                # 65 = ord('A')
+                if encode:
+                    cc = chr((ord(char) + ord(key_char.upper()) - 2 * 65) % 26 + 65)
+                else:
+                    cc = chr((ord(char) - ord(key_char.upper())) % 26 + 65)
+                append(cc if c.isupper() else cc.lower())
                 i = (i + 1) % key_length
             else:
-                res += c
-        return res
+                append(c)
+        return ''.join(res)
 
-    def _table(self, c: str, key_char: str) -> str:
+    def _apply_ascii(self, s: str) -> str:
+        data = np.frombuffer(s.encode('ascii'), dtype=np.uint8)
+        upper = data & ~np.uint8(0x20)
+        # Clearing the 0x20 bit maps ASCII letters, and only them, into [A-Z]
+        letters = np.flatnonzero((upper >= ord('A')) & (upper <= ord('Z')))
+        if not len(letters):
+            return s
+        key_codes = np.resize(self._key_codes, len(letters))
+        letter_codes = upper[letters].astype(np.int64)
         # 65 = ord('A')
         if self._mode == self._ENCODE:
-            return chr(((ord(c) + ord(key_char)) - 2 * 65) % 26 + 65)
+            shifted = (letter_codes + key_codes - 2 * 65) % 26 + 65
         else:
-            return chr((ord(c) - ord(key_char)) % 26 + 65)
+            shifted = (letter_codes - key_codes) % 26 + 65
+        res = data.copy()
+        # Restore the case of lowercase letters
+        res[letters] = shifted.astype(np.uint8) | (data[letters] & np.uint8(0x20))
+        return res.tobytes().decode('ascii')
@@ -1,11 +1,13 @@
 import abc
 import datetime
+import functools
 import ipaddress
 import re
 import typing as typ
 import urllib.parse
 
 from . import _core
+from . import _patterns
 from . import informatics
 from .. import utils
 
@@ -13,6 +15,8 @@ from .. import utils
 class _Extractor(_core.Operation, abc.ABC):
     """Base class for all extractors."""
 
+    __slots__ = ('_display_total', '_sort', '_unique', '_joiner')
+
     def __init__(self, display_total: bool = False, sort: bool = False, unique: bool = False, joiner: str = '\n'):
         """Create an extractor.
 
@@ -36,10 +40,17 @@ class _Extractor(_core.Operation, abc.ABC):
 
     def apply(self, s: str) -> str:
         values = self._extract(s)
-        if self._unique:
-            values = list(set(values))
-        if self._sort:
-            values.sort()
+        if not values:
+            return 'Total found: 0\n\n' if self._display_total else ''
+        if len(values) > 1:
+            if self._unique and self._sort:
+                # Faster than sorting then grouping equal values unless almost all values are distinct
+                values = sorted(set(values))
+            elif self._unique:
+                # Keep values in the order of their first occurrence
+                values = list(dict.fromkeys(values))
+            elif self._sort:
+                values.sort()
         res = self._joiner.join(values)
         if self._display_total:
             res = f'Total found: {len(values)}\n\n' + res
@@ -47,12 +58,34 @@ class _Extractor(_core.Operation, abc.ABC):
 
     @abc.abstractmethod
     def _extract(self, s: str) -> list[str]:
+        """Extracts all values from the given string.
+        Patterns without capture groups should use Pattern.findall() as it builds the matched strings
+        directly, without creating any Match object.
+
+        :param s: The string to extract values from.
+        :return: The extracted values, in order of appearance.
+        """
         pass
 
 
+# Addresses often occur several times in the same text
+@functools.lru_cache(maxsize=4096)
+def _is_private_ip(cast: typ.Type[ipaddress.IPv4Address | ipaddress.IPv6Address], address: str) -> bool:
+    """Check whether the given IP address is private.
+
+    :param cast: The class to parse the address with.
+    :param address: The address to check.
+    :return: True if the address is private, false otherwise.
+    :raise ipaddress.AddressValueError: If the address is invalid.
+    """
+    return cast(address).is_private
+
+
 class ExtractIps(_Extractor):
     """Extract all IP addresses."""
 
+    __slots__ = ('_ipv4', '_ipv6', '_hide_private')
+
     def __init__(self, display_total: bool = False, sort: bool = False, unique: bool = False,
                  ipv4: bool = True, ipv6: bool = True, hide_private: bool = False, joiner: str = '\n'):
         """Create an IP address extractor.
@@ -79,12 +112,16 @@ class ExtractIps(_Extractor):
     def _extract(self, s: str) -> list[str]:
         def _map(it: typ.Iterator[re.Match[str]], cast: typ.Type[ipaddress.IPv4Address | ipaddress.IPv6Address]) \
                 -> list[str]:
-            return [m.group() for m in it if not self._hide_private or not cast(m.group()).is_private]
+            addresses = [m.group() for m in it]
+            if self._hide_private:
+                return [address for address in addresses if not _is_private_ip(cast, address)]
+            return addresses
 
         ips = []
-        if self._ipv4:
+        # Addresses cannot be matched without their separator
+        if self._ipv4 and '.' in s:
             ips.extend(_map(informatics.DefangIpAddresses.IPV4_REGEX.finditer(s), ipaddress.IPv4Address))
-        if self._ipv6:
+        if self._ipv6 and ':' in s:
             ips.extend(_map(informatics.DefangIpAddresses.IPV6_REGEX.finditer(s), ipaddress.IPv6Address))
         return ips
 
@@ -92,63 +129,59 @@ class ExtractIps(_Extractor):
 class ExtractMacAddresses(_Extractor):
     """Extract all MAC addresses."""
 
-    _MAC_ADDRESS_REGEX = re.compile(r'(?:[a-fA-F\d]{1,2}:){5}[a-fA-F\d]{1,2}')
+    __slots__ = ()
 
     def _extract(self, s: str) -> list[str]:
-        return self._MAC_ADDRESS_REGEX.findall(s)
+        if ':' not in s:  # Avoid scanning the whole string with the regex if it cannot match
+            return []
+        return _patterns.get('MAC').findall(s)
 
 
 class ExtractUrls(_Extractor):
     """Extract all URLs."""
 
-    _URL_REGEX = re.compile(r"""\w*://[\w.-]+(?:\.[\w.-]+)+[-\w._~:/?#\[\]@!$&'()*+,;=]+""")
+    __slots__ = ()
 
     def _extract(self, s: str) -> list[str]:
-        return self._URL_REGEX.findall(s)
+        if '://' not in s:
+            return []
+        return _patterns.get('URL').findall(s)
 
 
 class ExtractDomains(ExtractUrls):
     """Extract all URL domains."""
 
+    __slots__ = ()
+
     def _extract(self, s: str) -> list[str]:
-        return [urllib.parse.urlparse(url).netloc for url in self._URL_REGEX.findall(s)]
+        return list(map(self._get_netloc, super()._extract(s)))
+
+    @staticmethod
+    def _get_netloc(url: str) -> str:
+        if not (m := _patterns.get('URL_NETLOC').match(url)):
+            return ''  # Invalid scheme, urllib.parse.urlparse() does not see any network location
+        netloc = m.group(1)
+        if netloc.isascii() and '[' not in netloc and ']' not in netloc:
+            return netloc
+        # Let urllib validate IPv6 and non-ASCII locations
+        return urllib.parse.urlparse(url).netloc
 
 
 class ExtractEmails(_Extractor):
     """Extract all email addresses."""
 
-    # https://www.emailregex.com/
-    _EMAIL_REGEX = re.compile(r"""
-(?:
-     [a-z\d!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z\d!#$%&'*+/=?^_`{|}~-]+)*
-    |"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*"
-)
-@
-(?:
-     (?:[a-z0-9](?:[a-z\d-]*[a-z\d])?\.)+[a-z\d](?:[a-z\d-]*[a-z\d])?
-    |\[(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}
-     (?:
-         25[0-5]
-        |2[0-4]\d
-        |[01]?\d\d?
-        |[a-z\d-]*[a-z\d]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+
-     )]
-)
-""", re.VERBOSE)
+    __slots__ = ()
 
     def _extract(self, s: str) -> list[str]:
-        return self._EMAIL_REGEX.findall(s)
+        if '@' not in s:
+            return []
+        return _patterns.get('EMAIL').findall(s)
 
 
 class ExtractFilePaths(_Extractor):
     """Extract all file paths."""
 
-    # Illegal characters: https://stackoverflow.com/a/31976060/3779986
-    _UNIX_FP_REGEX = re.compile(r'/(?:[^/\0\n\r]+/?)+|(?:[^/\0\n\r]+/)+[^/\0\n\r]*')
-    _UNIX_FP_REGEX_NO_WS = re.compile(_UNIX_FP_REGEX.pattern.replace(r'\n\r', r'\s'))
-    _WINDOWS_FP_REGEX = re.compile(
-        r'[a-zA-Z]:\\(?:[^\\<>:"/|?*\x00-\x1f\n\r]+\\?)+|(?:[^\\<>:"/|?*\x00-\x1f\n\r]+\\)+[^\\<>:"/|?*\x00-\x1f\n\r]*')
-    _WINDOWS_FP_REGEX_NO_WS = re.compile(_WINDOWS_FP_REGEX.pattern.replace(r'\n\r', r'\s'))
+    __slots__ = ('_unix', '_windows', '_exclude_ws')
 
     def __init__(self, display_total: bool = False, sort: bool = False, unique: bool = False,
                  unix: bool = True, windows: bool = True, exclude_ws: bool = True, joiner: str = '\n'):
@@ -178,9 +211,36 @@ class ExtractFilePaths(_Extractor):
     def _extract(self, s: str) -> list[str]:
         paths = []
         if self._unix:
-            paths.extend((self._UNIX_FP_REGEX_NO_WS if self._exclude_ws else self._UNIX_FP_REGEX).findall(s))
+            pattern = _patterns.get('UNIX_FP_NO_WS' if self._exclude_ws else 'UNIX_FP')
+            paths.extend(self._find_in_lines(pattern, s, '/'))
         if self._windows:
-            paths.extend((self._WINDOWS_FP_REGEX_NO_WS if self._exclude_ws else self._WINDOWS_FP_REGEX).findall(s))
+            pattern = _patterns.get('WINDOWS_FP_NO_WS' if self._exclude_ws else 'WINDOWS_FP')
+            paths.extend(self._find_in_lines(pattern, s, '\\'))
+        return paths
+
+    @staticmethod
+    def _find_in_lines(pattern: re.Pattern[str], s: str, sep: str) -> list[str]:
+        """Find all paths in the lines that contain the given path separator.
+        As paths cannot span over '\\n' or '\\r', other lines cannot contain any match
+        and are skipped without running the regex on them.
+
+        :param pattern: The path regex.
+        :param s: The string to search into.
+        :param sep: The path separator.
+        :return: The list of matched paths.
+        """
+        paths = []
+        length = len(s)
+        end = 0
+        # Search for the separator using fast literal search then run the regex on its line only
+        while (i := s.find(sep, end)) != -1:
+            # Line bounds searches are limited to the current line to keep the whole scan linear
+            start = max(s.rfind('\n', end, i), s.rfind('\r', end, i)) + 1
+            if (end := s.find('\n', i)) == -1:
+                end = length
+            if (cr := s.find('\r', i, end)) != -1:
+                end = cr
+            paths.extend(pattern.findall(s, start, end))
         return paths
 
 
@@ -189,31 +249,41 @@ class ExtractDates(_Extractor):
     Separators may be any of "/-." or space.
     """
 
-    @staticmethod
-    def __generate(s: str):
-        for sep in '-/. ':
-            yield s.replace('§', sep)
+    __slots__ = ()
 
-    _DATE_REGEX = re.compile(r'\d{4}(?:[-/. ]\d{2}){2}|(?:\d{2}[-/. ]){2}\d{4}')
-    _FORMATS = (*__generate('%Y§%m§%d'), *__generate('%d§%m§%Y'), *__generate('%m§%d§%Y'))
+    _SEPARATORS = '-/. '
 
     def _extract(self, s: str) -> list[str]:
-        def f(m: str) -> bool:
-            for df in self._FORMATS:
-                try:
-                    datetime.datetime.strptime(m, df)
-                    return True
-                except ValueError:
-                    pass
-            return False
+        return [m for m in _patterns.get('DATE').findall(s) if self._is_valid_date(m)]
 
-        matches = self._DATE_REGEX.finditer(s)
-        return list(filter(f, (m.group(0) for m in matches)))
+    @classmethod
+    def _is_valid_date(cls, s: str) -> bool:
+        if not s.isascii():  # Only consider ASCII digits
+            return False
+        # Both separators must be the same
+        if s[4] in cls._SEPARATORS:  # yyyy-mm-dd
+            seps = s[4], s[7]
+            candidates = ((s[:4], s[5:7], s[8:]),)
+        else:  # dd-mm-yyyy or mm-dd-yyyy
+            seps = s[2], s[5]
+            candidates = ((s[6:], s[3:5], s[:2]), (s[6:], s[:2], s[3:5]))
+        if seps[0] != seps[1]:
+            return False
+        for year, month, day in candidates:
+            try:
+                datetime.date(int(year), int(month), int(day))
+                return True
+            except ValueError:
+                pass
+        return False
 
 
 class Regex(_core.Operation):
     """Extract strings that match a regular expression."""
 
+    __slots__ = ('_regex', '_flags', '_display_total', '_output_format', '_joiner', '_match_groups_joiner',
+                 '_groups_joiner', '_map')
+
     _MATCHES = 'matches'
     _GROUPS = 'groups'
     _MATCHES_GROUPS = 'matches_and_groups'
@@ -233,13 +303,19 @@ class Regex(_core.Operation):
         """
         if output_format not in (self._MATCHES, self._GROUPS, self._MATCHES_GROUPS):
             raise ValueError(f'invalid output format: {output_format!r}')
-        self._regex = re.compile(regex, flags=utils.regex_flags_to_int(flags))
+        self._regex = utils.compile_regex(regex, flags)
         self._flags = flags
         self._display_total = display_total
         self._output_format = output_format
         self._joiner = utils.unescape(joiner)
         self._match_groups_joiner = utils.unescape(match_groups_joiner)
         self._groups_joiner = utils.unescape(groups_joiner)
+        # Select the match formatting function once instead of for each match
+        self._map = {
+            self._MATCHES: self._map_match,
+            self._GROUPS: self._map_groups,
+            self._MATCHES_GROUPS: self._map_match_and_groups,
+        }[output_format]
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -253,15 +329,20 @@ class Regex(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        def _map(m: re.Match) -> str:
-            match self._output_format:
-                case self._MATCHES:
-                    return m.group(0)
-                case self._GROUPS:
-                    return self._groups_joiner.join(m.groups())
-                case self._MATCHES_GROUPS:
-                    return f'{m.group(0)}{self._match_groups_joiner}{self._groups_joiner.join(m.groups())}'
-
-        matches = list(self._regex.finditer(s))
+        if self._output_format == self._MATCHES and not self._regex.groups:
+            # Without capture groups, findall() returns whole matches without creating any Match object
+            matches = self._regex.findall(s)
+        else:
+            matches = list(map(self._map, self._regex.finditer(s)))
         res = f'Total: {len(matches)}\n\n' if self._display_total else ''
-        return res + self._joiner.join(map(_map, matches))
+        return res + self._joiner.join(matches)
+
+    @staticmethod
+    def _map_match(m: re.Match) -> str:
+        return m.group(0)
+
+    def _map_groups(self, m: re.Match) -> str:
+        return self._groups_joiner.join(m.groups())
+
+    def _map_match_and_groups(self, m: re.Match) -> str:
+        return f'{m.group(0)}{self._match_groups_joiner}{self._groups_joiner.join(m.groups())}'
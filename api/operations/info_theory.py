@@ -3,17 +3,33 @@ import math
 import re
 import typing as typ
 
+import numpy as np
+
 from . import _core
 from .. import utils
 
 
+_VECTORIZATION_THRESHOLD = 1024
+
+
 class Entropy(_core.Operation):
     """Calculate the Shannon entropy of a text."""
 
     def apply(self, s: str) -> str:
         # https://en.wikipedia.org/wiki/Entropy_(information_theory)
-        frequencies = (i / len(s) for i in collections.Counter(s).values())
-        return str(-sum(f * math.log(f, 2) for f in frequencies))
+        if len(s) < _VECTORIZATION_THRESHOLD:
+            frequencies = (i / len(s) for i in collections.Counter(s).values())
+            return str(-sum(f * math.log(f, 2) for f in frequencies))
+        # UTF-32 maps each code point to a single integer, preserving per-character semantics
+        # 'surrogatepass' keeps lone surrogates, that may come from surrogateescape-decoded input
+        code_points = np.frombuffer(s.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        if s.isascii():
+            counts = np.bincount(code_points, minlength=128)
+            counts = counts[counts > 0]
+        else:
+            counts = np.unique(code_points, return_counts=True)[1]
+        frequencies = counts / len(s)
+        return str(float(-(frequencies * np.log2(frequencies)).sum()))
 
 
 class FrequencyDist(_core.Operation):
@@ -38,15 +54,17 @@ class FrequencyDist(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        counts = collections.Counter(bytes(s, self._encoding))
-        if self._show_zeros:
-            for i in range(255):
-                if i not in counts:
-                    counts[i] = 0
-        if self._show_ascii:
-            counts = {chr(b): c for b, c in counts.items()}
-        frequencies = sorted(counts.items(), key=lambda e: e[0])
-        return ','.join(f'{b}:{c}' for b, c in frequencies)
+        data = s.encode(self._encoding)
+        if len(data) < _VECTORIZATION_THRESHOLD:
+            counts = collections.Counter(data)
+            values = range(256) if self._show_zeros else sorted(counts)
+        else:
+            counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+            # Counts are already in byte order, no sorting needed
+            values = range(256) if self._show_zeros else np.flatnonzero(counts).tolist()
+            counts = counts.tolist()
+        key = chr if self._show_ascii else str
+        return ','.join(f'{key(b)}:{counts[b]}' for b in values)
 
 
 class CoincidenceIndex(_core.Operation):
@@ -54,15 +72,28 @@ class CoincidenceIndex(_core.Operation):
     IC for monocase English text is around 1.73.
     """
 
+    _NON_LETTER_REGEX = re.compile(r'[^a-z]')
+
     def apply(self, s: str) -> str:
-        s = re.sub(r'[^a-z]', '', s.lower())
-        n = len(s)
+        if len(s) < _VECTORIZATION_THRESHOLD:
+            s = self._NON_LETTER_REGEX.sub('', s.lower())
+            n = len(s)
+            counts = list(collections.Counter(s).values())
+        else:
+            # Some non-ASCII characters have ASCII lowercase forms (e.g. Kelvin sign)
+            # Lone surrogates are encoded as bytes >= 0x80, which never map to letters
+            data = np.frombuffer((s if s.isascii() else s.lower()).encode('utf8', 'surrogatepass'), dtype=np.uint8)
+            # Setting the 0x20 bit maps ASCII letters, and only them, into [a-z]
+            data = data | np.uint8(0x20)
+            letters = data[(data >= ord('a')) & (data <= ord('z'))]
+            n = len(letters)
+            counts = np.bincount(letters - ord('a'), minlength=26)
+            counts = counts[counts > 0].tolist()
         if n <= 1:
             return '0'
-        counts = collections.Counter(s)
         c = len(counts)
         # https://en.wikipedia.org/wiki/Index_of_coincidence
-        return sum(ni * (ni - 1) for ni in counts.values()) / (n * (n - 1) / c)
+        return str(sum(ni * (ni - 1) for ni in counts) / (n * (n - 1) / c))
 
 
 class HammingDistance(_core.Operation):
@@ -1,3 +1,4 @@
+import collections
 import ipaddress
 import re
 import typing as typ
@@ -13,7 +14,9 @@ class DefangIpAddresses(_core.Operation):
     IPV4_REGEX = re.compile(
         r'((2(5[0-6]|[0-4]\d)|1?\d{2}|\d{1,2})\.){3}(2(5[0-6]|[0-4]\d)|1?\d{2}|\d{1,2})')
     # https://stackoverflow.com/a/17871737/3779986
-    IPV6_REGEX = re.compile(r"""(
+    # The lookahead rejects most positions before trying each alternative, it does not change matches
+    IPV6_REGEX = re.compile(r"""(?=[0-9a-fA-F]{0,4}:)  # All addresses have a colon in their first 5 characters
+(
 ([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|            # 1:2:3:4:5:6:7:8
 ([0-9a-fA-F]{1,4}:){1,7}:|                         # 1::                              1:2:3:4:5:6:7::
 ([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|         # 1::8             1:2:3:4:5:6::8  1:2:3:4:5:6::8
@@ -34,8 +37,21 @@ fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]+| # fe80::7:8%eth0   fe80::7:8%1 (link
 )""", re.VERBOSE)
 
     def apply(self, s: str) -> str:
-        s = self.IPV4_REGEX.sub(lambda m: m.group().replace('.', '[.]'), s)
-        return self.IPV6_REGEX.sub(lambda m: m.group().replace(':', '[:]'), s)
+        # Both passes are needed as IPv6 matches may hide IPv4 addresses that the first pass catches,
+        # e.g. in "::ffff:1.2.3.4". A pass is skipped if its separator is absent, as it cannot match.
+        if '.' in s:
+            s = self.IPV4_REGEX.sub(self._defang_ipv4, s)
+        if ':' in s:
+            s = self.IPV6_REGEX.sub(self._defang_ipv6, s)
+        return s
+
+    @staticmethod
+    def _defang_ipv4(m: re.Match[str]) -> str:
+        return m.group().replace('.', '[.]')
+
+    @staticmethod
+    def _defang_ipv6(m: re.Match[str]) -> str:
+        return m.group().replace(':', '[:]')
 
 
 class GroupIpAddresses(_core.Operation):
@@ -62,36 +78,69 @@ class GroupIpAddresses(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        ipv4_networks = {}
-        ipv6_networks = {}
+        # IPv4 addresses are grouped as integers, networks are mapped to (address, text) pairs
+        ipv4_mask = min(self._subnet, 32)
+        ipv4_netmask = (0xffffffff << (32 - ipv4_mask)) & 0xffffffff
+        ipv4_networks = collections.defaultdict(list)
+        ipv6_networks = collections.defaultdict(list)
 
         for line in s.split(self._sep):
+            if (address := self._parse_ipv4(line)) is not None:
+                # Strictly parsed addresses are already in their compressed form
+                ipv4_networks[address & ipv4_netmask].append((address, line))
+                continue
             try:
                 ip = ipaddress.ip_address(line)
-                mask = min(self._subnet, 128 if isinstance(ip, ipaddress.IPv6Address) else 32)
-                network = ipaddress.ip_interface(f'{line}/{mask}').network
             except ValueError:
                 continue
-            if isinstance(network, ipaddress.IPv4Network):
-                if network not in ipv4_networks:
-                    ipv4_networks[network] = []
-                ipv4_networks[network].append(ip)
+            if isinstance(ip, ipaddress.IPv4Address):
+                ipv4_networks[int(ip) & ipv4_netmask].append((int(ip), ip.compressed))
             else:
-                if network not in ipv6_networks:
-                    ipv6_networks[network] = []
+                mask = min(self._subnet, 128)
+                if ip.scope_id:
+                    # Scoped addresses keep their scope in /128 networks, which integers cannot represent
+                    network = ipaddress.ip_interface(f'{line}/{mask}').network
+                else:
+                    # Build the network from the parsed address instead of parsing the line again
+                    network = ipaddress.IPv6Network((int(ip), mask), strict=False)
                 ipv6_networks[network].append(ip)
 
-        return f'{self._format(ipv4_networks)}{self._format(ipv6_networks)}'.strip()
+        return f'{self._format_ipv4(ipv4_networks, ipv4_mask)}{self._format(ipv6_networks)}'.strip()
+
+    @staticmethod
+    def _parse_ipv4(s: str) -> int | None:
+        """Parse an IPv4 address with the same rules as ipaddress.IPv4Address but without creating any object.
+
+        :param s: The string to parse.
+        :return: The address as an integer or None if the string is not a valid IPv4 address.
+        """
+        octets = s.split('.')
+        if len(octets) != 4:
+            return None
+        address = 0
+        for octet in octets:
+            # Leading zeros are rejected as they are ambiguous (octal or decimal)
+            if not (octet.isascii() and octet.isdigit()) or len(octet) > 3 or (octet[0] == '0' and octet != '0'):
+                return None
+            if (value := int(octet)) > 255:
+                return None
+            address = (address << 8) | value
+        return address
+
+    @staticmethod
+    def _format_ipv4(networks: dict[int, list[tuple[int, str]]], mask: int) -> str:
+        res = []
+        for network in sorted(networks):
+            res.append(f'{ipaddress.IPv4Address(network).compressed}/{mask}\n')
+            res.extend(f'  {ip}\n' for _, ip in sorted(networks[network]))
+            res.append('\n')
+        return ''.join(res)
 
     @staticmethod
-    def _format(networks: dict[ipaddress.IPv4Network | ipaddress.IPv6Network,
-                               list[ipaddress.IPv4Address | ipaddress.IPv6Address]]) -> str:
-        res = ''
-        for network in sorted(networks.keys()):
-            ips = networks[network]
-            ips.sort()
-            res += network.compressed + '\n'
-            for ip in ips:
-                res += f'  {ip.compressed}\n'
-            res += '\n'
-        return res
+    def _format(networks: dict[ipaddress.IPv6Network, list[ipaddress.IPv6Address]]) -> str:
+        res = []
+        for network in sorted(networks):
+            res.append(f'{network.compressed}\n')
+            res.extend(f'  {ip.compressed}\n' for ip in sorted(networks[network]))
+            res.append('\n')
+        return ''.join(res)
@@ -1,18 +1,19 @@
-import re
-
 from .. import _core
 
 
 class ParseUnixFilePerms(_core.Operation):
     """Parse a UNIX file permission string. Supports both literal and octal notations."""
 
-    _LITERAL_REGEX = re.compile(
-        '(?P<ftype>[-dlpscbD])'
-        '(?P<ur>[-r])(?P<uw>[-w])(?P<ux>[-xsS])'
-        '(?P<gr>[-r])(?P<gw>[-w])(?P<gx>[-xsS])'
-        '(?P<or>[-r])(?P<ow>[-w])(?P<ox>[-xtT])'
-    )
-    _NUMERIC_REGEX = re.compile('(?P<b>[0-7])(?P<u>[0-7])(?P<g>[0-7])(?P<o>[0-7])')
+    # Allowed characters for each position of the literal and octal notations
+    _LITERAL_CHARS = ('-dlpscbD', '-r', '-w', '-xsS', '-r', '-w', '-xsS', '-r', '-w', '-xtT')
+    _OCTAL_DIGITS = frozenset('01234567')
+
+    # Output characters indexed by permission bits, (special << 1) | execute for execute characters
+    _READ = '-r'
+    _WRITE = '-w'
+    _EXECUTE_SETID = '-xSs'
+    _EXECUTE_STICKY = '-xTt'
+    _CHECKBOX = ' X'
 
     _FILE_TYPES = {
         '-': 'File',
@@ -26,69 +27,38 @@ class ParseUnixFilePerms(_core.Operation):
     }
 
     def apply(self, s: str) -> str:
-        def r(r_: bool) -> str:
-            return 'r' if r_ else '-'
-
-        def w(w_: bool) -> str:
-            return 'w' if w_ else '-'
-
-        def xs(x_: bool, s_: bool) -> str:
-            match x_, s_:
-                case True, True:
-                    return 's'
-                case False, True:
-                    return 'S'
-                case True, False:
-                    return 'x'
-                case False, False:
-                    return '-'
-
-        def xt(x_: bool, t_: bool) -> str:
-            match x_, t_:
-                case True, True:
-                    return 't'
-                case False, True:
-                    return 'T'
-                case True, False:
-                    return 'x'
-                case False, False:
-                    return '-'
-
-        def octal(r_: bool, w_: bool, x_: bool) -> int:
-            return (r_ << 2) | (w_ << 1) | x_
-
-        def x(b: bool) -> str:
-            return 'X' if b else ' '
-
-        if match := self._LITERAL_REGEX.match(s):
-            ftype = match.group('ftype')
-            ur = match.group('ur') == 'r'
-            uw = match.group('uw') == 'w'
-            ux = match.group('ux') in 'xs'
-            gr = match.group('gr') == 'r'
-            gw = match.group('gw') == 'w'
-            gx = match.group('gx') in 'xs'
-            or_ = match.group('or') == 'r'
-            ow = match.group('ow') == 'w'
-            ox = match.group('ox') in 'xt'
-            us = match.group('ux') in 'sS'
-            gs = match.group('gx') in 'sS'
-            ot = match.group('ox') in 'tT'
-        elif match := self._NUMERIC_REGEX.match(s):
+        # Fixed-width notations are checked by direct indexing, only their prefix is considered
+        if len(s) >= 10 and all(c in chars for c, chars in zip(s, self._LITERAL_CHARS)):
+            ftype = s[0]
+            ur = s[1] == 'r'
+            uw = s[2] == 'w'
+            ux = s[3] in 'xs'
+            gr = s[4] == 'r'
+            gw = s[5] == 'w'
+            gx = s[6] in 'xs'
+            or_ = s[7] == 'r'
+            ow = s[8] == 'w'
+            ox = s[9] in 'xt'
+            us = s[3] in 'sS'
+            gs = s[6] in 'sS'
+            ot = s[9] in 'tT'
+        elif len(s) >= 4 and self._OCTAL_DIGITS.issuperset(s[:4]):
             ftype = None
-            bo = int(match.group('b'))
-            uo = int(match.group('u'))
-            go = int(match.group('g'))
-            oo = int(match.group('o'))
+            bo, uo, go, oo = int(s[0]), int(s[1]), int(s[2]), int(s[3])
             ur, uw, ux = bool(uo & 4), bool(uo & 2), bool(uo & 1)
             gr, gw, gx = bool(go & 4), bool(go & 2), bool(go & 1)
             or_, ow, ox = bool(oo & 4), bool(oo & 2), bool(oo & 1)
             us, gs, ot = bool(bo & 4), bool(bo & 2), bool(bo & 1)
         else:
             raise ValueError('could not find a valid file permission string')
+        r, w, xs, xt = self._READ, self._WRITE, self._EXECUTE_SETID, self._EXECUTE_STICKY
+        textual = (f'{ftype or "-"}{r[ur]}{w[uw]}{xs[us << 1 | ux]}{r[gr]}{w[gw]}{xs[gs << 1 | gx]}'
+                   f'{r[or_]}{w[ow]}{xt[ot << 1 | ox]}')
+        octal = f'{us << 2 | gs << 1 | ot}{ur << 2 | uw << 1 | ux}{gr << 2 | gw << 1 | gx}{or_ << 2 | ow << 1 | ox}'
+        x = self._CHECKBOX
         return f"""\
-Textual representation: {ftype or '-'}{r(ur)}{w(uw)}{xs(ux, us)}{r(gr)}{w(gw)}{xs(gx, gs)}{r(or_)}{w(ow)}{xt(ox, ot)}
-Octal representation:   {octal(us, gs, ot)}{octal(ur, uw, ux)}{octal(gr, gw, gx)}{octal(or_, ow, ox)}
+Textual representation: {textual}
+Octal representation:   {octal}
 File type: {self._FILE_TYPES[ftype] if ftype else 'Unknown'}
 setuid bit: {int(us)}
 setgid bit: {int(gs)}
@@ -96,10 +66,10 @@ sticky bit: {int(ot)}
           +-------+-------+-------+
           | User  | Group | Other |
 +---------+-------+-------+-------+
-|    Read |   {x(ur)}   |   {x(gr)}   |   {x(or_)}   |
+|    Read |   {x[ur]}   |   {x[gr]}   |   {x[or_]}   |
 +---------+-------+-------+-------+
-|   Write |   {x(uw)}   |   {x(gw)}   |   {x(ow)}   |
+|   Write |   {x[uw]}   |   {x[gw]}   |   {x[ow]}   |
 +---------+-------+-------+-------+
-| Execute |   {x(ux)}   |   {x(gx)}   |   {x(ox)}   |
+| Execute |   {x[ux]}   |   {x[gx]}   |   {x[ox]}   |
 +---------+-------+-------+-------+
 """
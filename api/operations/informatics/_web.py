@@ -1,6 +1,6 @@
 import abc
+import functools
 import html
-import io
 import json
 import re
 import typing as typ
@@ -15,6 +15,37 @@ from .. import _core
 from .. import utils
 
 
+_PERCENT_ENCODED_REGEX = re.compile(r'(?:%[\da-fA-F]{2})+')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_xpath(query: str) -> lxml.etree.XPath:
+    """Compile the given XPath query. Compiled queries are cached.
+
+    :param query: The query to compile.
+    :return: The compiled query.
+    :raises lxml.etree.XPathEvalError: If the query is invalid.
+    """
+    try:
+        return lxml.etree.XPath(query)
+    except lxml.etree.XPathSyntaxError as e:
+        # Raise the same error as ElementTree.xpath() does for invalid queries
+        raise lxml.etree.XPathEvalError(str(e)) from e
+
+
+def _unquote(s: str) -> str:
+    """Decode all %xx escapes, like urllib.parse.unquote() does.
+    Consecutive escapes are decoded at once, instead of going through urllib's per-escape Python loop.
+    As ASCII bytes cannot be part of multibyte UTF-8 sequences, decoding runs separately gives the same result.
+
+    :param s: The string to decode.
+    :return: The decoded string.
+    """
+    if '%' not in s:
+        return s
+    return _PERCENT_ENCODED_REGEX.sub(lambda m: bytes.fromhex(m.group().replace('%', '')).decode('utf8', 'replace'), s)
+
+
 class EncodeUrl(_core.Operation):
     """Escape some special characters from a URL: []@!$'\"()*+,;% and non-ASCII characters."""
 
@@ -33,14 +64,14 @@ class DecodeUrl(_core.Operation):
     """Replace all %xx values by the corresponding UTF-8 character."""
 
     def apply(self, s: str) -> str:
-        return urllib.parse.unquote(s)
+        return _unquote(s)
 
 
 class DecodeUrlComponent(_core.Operation):
     """Replace all %xx values by the corresponding UTF-8 character and replaces the '+' sign by a space."""
 
     def apply(self, s: str) -> str:
-        return urllib.parse.unquote_plus(s)
+        return _unquote(s.replace('+', ' '))
 
 
 class ParseUrl(_core.Operation):
@@ -87,6 +118,71 @@ class DefangUrls(_core.Operation):
         return s
 
 
+class _HtmlTextCollector:
+    """lxml parser target that collects the text of a HTML document without building any tree.
+    The result is the same as the .text attribute of a BeautifulSoup object built with the 'lxml' parser."""
+
+    _PRESERVE_WS_TAGS = frozenset(('pre', 'textarea'))
+    # BeautifulSoup does not consider the text inside these tags as plain strings
+    _STRING_CONTAINER_TAGS = frozenset(('rt', 'rp', 'style', 'script', 'template'))
+    _ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+    def __init__(self):
+        self._tags: list[str] = []
+        self._preserve_ws_depth = 0
+        self._string_container_depth = 0
+        self._data: list[str] = []
+        self._texts: list[str] = []
+
+    def start(self, name: str, _attrs):
+        self._end_data()
+        self._tags.append(name)
+        if name in self._PRESERVE_WS_TAGS:
+            self._preserve_ws_depth += 1
+        if name in self._STRING_CONTAINER_TAGS:
+            self._string_container_depth += 1
+
+    def end(self, _name: str):
+        self._end_data()
+        # lxml always sends balanced start/end events
+        name = self._tags.pop()
+        if name in self._PRESERVE_WS_TAGS:
+            self._preserve_ws_depth -= 1
+        if name in self._STRING_CONTAINER_TAGS:
+            self._string_container_depth -= 1
+
+    def data(self, content: str):
+        self._data.append(content)
+
+    def comment(self, content: str):
+        self._end_data()
+        self._data.append(content)
+        self._end_data(keep=False)
+
+    def pi(self, target: str, data: str):
+        self._end_data()
+        self._data.append(target + ' ' + data)
+        self._end_data(keep=False)
+
+    def doctype(self, *_):
+        self._end_data()
+
+    def close(self) -> str:
+        self._end_data()
+        return ''.join(self._texts)
+
+    def _end_data(self, keep: bool = True):
+        if not self._data:
+            return
+        data = ''.join(self._data)
+        self._data.clear()
+        if keep and not self._string_container_depth:
+            # Strings made only of ASCII whitespace are collapsed, unless whitespace is preserved
+            if not self._preserve_ws_depth and not data.strip(self._ASCII_SPACES):
+                data = '\n' if '\n' in data else ' '
+            self._texts.append(data)
+
+
 class RemoveHtml(_core.Operation):
     """Remove all HTML/XML tags."""
 
@@ -94,7 +190,10 @@ class RemoveHtml(_core.Operation):
     _TRAILING_WS_REGEX = re.compile(r'(^[\t ]+|[\t ]+$)', flags=re.MULTILINE)
 
     def apply(self, s: str) -> str:
-        text = bs4.BeautifulSoup(s, 'lxml').text.strip()
+        # Text is collected directly from lxml's parsing events instead of going through a BeautifulSoup tree
+        parser = lxml.etree.HTMLParser(target=_HtmlTextCollector(), strip_cdata=False, recover=True)
+        parser.feed(s.removeprefix('\ufeff'))
+        text = parser.close().strip()
         return self._WS_REGEX.sub('\n', self._TRAILING_WS_REGEX.sub('', text))
 
 
@@ -126,7 +225,11 @@ class Xpath(_QueryPath):
                 return e
             return lxml.html.tostring(e).decode('utf8').strip()
 
-        r = lxml.etree.parse(io.StringIO(s)).xpath(self._query)
+        # Parsers cannot be shared between threads, a new one is created for each call
+        # Documents are passed as UTF-8 bytes, any encoding declared by the document itself is ignored
+        parser = lxml.etree.XMLParser(encoding='utf-8')
+        tree = lxml.etree.fromstring(s.encode('utf8'), parser).getroottree()
+        r = _compile_xpath(self._query)(tree)
         return self._joiner.join(map(_str, r))
 
 
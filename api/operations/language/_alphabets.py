@@ -48,15 +48,16 @@ class ToNato(_core.Operation):
         '9': 'Niner',
         '.': 'Stop',
     }
+    # Translation table for str.translate(), each word is followed by a space.
+    # KELVIN SIGN is the only other character whose lowercase form is in the alphabet.
+    _TABLE = {ord(c): v + ' ' for k, v in _NATO.items() for c in (k, k.upper())} | {ord('\u212a'): _NATO['k'] + ' '}
 
     def apply(self, s: str) -> str:
-        def aux(i: int, c: str) -> str:
-            c_ = self._NATO.get(c.lower(), c)
-            if i < len(s) - 1 and c_ != c:
-                c_ += ' '
-            return c_
-
-        return ''.join(aux(i, c) for i, c in enumerate(s))
+        res = s.translate(self._TABLE)
+        # Remove the space after the last word
+        if s and ord(s[-1]) in self._TABLE:
+            res = res[:-1]
+        return res
 
 
 class _MorseCode(_core.Operation, abc.ABC):
@@ -159,7 +160,8 @@ class _MorseCode(_core.Operation, abc.ABC):
     }
     _MORSE_TO_UNICODE = utils.flip_dict(_UNICODE_TO_MORSE)
     _ERROR = '[?]'
-    _EXTENDED_REGEX = re.compile(r"""[^a-z0-9?,.;"'’\n\r\t]""")
+    # Characters allowed when extended mode is off
+    _BASIC_CHARS = frozenset("""abcdefghijklmnopqrstuvwxyz0123456789?,.;"'’\n\r\t""")
 
     def __init__(self, dot: str = '.', dash='-', letter_sep=' ', word_sep: str = '/', extended: bool = False):
         """Create a Morse encoder/decoder.
@@ -175,6 +177,8 @@ class _MorseCode(_core.Operation, abc.ABC):
         self._letter_sep = utils.unescape(letter_sep)
         self._word_sep = utils.unescape(word_sep)
         self._extended = extended
+        # Cache of the translations of individual letters, filled as they are encountered
+        self._translations: dict[str, str] = {}
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -189,16 +193,29 @@ class _MorseCode(_core.Operation, abc.ABC):
 class ToMorseCode(_MorseCode):
     """Encode text to Morse code."""
 
+    _WHITESPACE_REGEX = re.compile(r'\s')
+
     def apply(self, s: str) -> str:
-        words = []
-        for word in re.split(r'\s', s):
-            m_word = []
-            for c in word:
-                c = c.lower()
-                if self._extended or not self._EXTENDED_REGEX.fullmatch(c):
-                    m_word.append(self._UNICODE_TO_MORSE.get(c, '').replace('.', self._dot).replace('-', self._dash))
-            words.append(self._letter_sep.join(m_word))
-        return self._word_sep.join(words)
+        translations = self._translations
+        for c in set(s).difference(translations):
+            translations[c] = self._translate(c)
+        # Each translation starts with the letter separator, remove the one before the first letter of each word
+        sep_length = len(self._letter_sep)
+        return self._word_sep.join(
+            ''.join(map(translations.__getitem__, word))[sep_length:] for word in self._WHITESPACE_REGEX.split(s)
+        )
+
+    def _translate(self, c: str) -> str:
+        """Translate a character into Morse code, preceded by the letter separator.
+
+        :param c: The character to translate.
+        :return: The translation or an empty string if the character should be ignored.
+        """
+        c = c.lower()
+        # Lowercase forms of some characters span several code points, they are not considered extended
+        if self._extended or c in self._BASIC_CHARS or len(c) != 1:
+            return self._letter_sep + self._UNICODE_TO_MORSE.get(c, '').replace('.', self._dot).replace('-', self._dash)
+        return ''
 
 
 class FromMorseCode(_MorseCode):
@@ -219,16 +236,28 @@ class FromMorseCode(_MorseCode):
         self._caps = caps
 
     def apply(self, s: str) -> str:
-        words = []
-        for m_word in s.split(self._word_sep):
-            word = ''
-            for m_c in m_word.split(self._letter_sep):
-                c = self._MORSE_TO_UNICODE.get(m_c.replace(self._dot, '.').replace(self._dash, '-'), self._ERROR)
-                if c[0] == '[' or self._extended or not self._EXTENDED_REGEX.fullmatch(c):
-                    if self._caps and c[0] != '[':
-                        c = c.upper()
-                    word += c
-                else:
-                    word += self._ERROR
-            words.append(word)
-        return ' '.join(words)
+        # Translations are never empty
+        get = self._translations.get
+        translate = self._translate
+        letter_sep = self._letter_sep
+        return ' '.join(
+            ''.join([get(m_c) or translate(m_c) for m_c in m_word.split(letter_sep)])
+            for m_word in s.split(self._word_sep)
+        )
+
+    def _translate(self, m_c: str) -> str:
+        """Translate a Morse code letter. Only valid letters are cached as other strings are unbounded.
+
+        :param m_c: The Morse code to translate.
+        :return: The translated character or an error marker.
+        """
+        c = self._MORSE_TO_UNICODE.get(m_c.replace(self._dot, '.').replace(self._dash, '-'))
+        if c is None:
+            return self._ERROR
+        if c[0] != '[':  # Prosigns are left as is
+            if not self._extended and c not in self._BASIC_CHARS:
+                c = self._ERROR
+            elif self._caps:
+                c = c.upper()
+        self._translations[m_c] = c
+        return c
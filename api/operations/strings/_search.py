@@ -17,6 +17,7 @@ class RemoveWhitespace(_core.Operation):
             raise ValueError(
                 f'found non-whitespace character in exclusion list at index {match.start(1) + 1}: {match.group(1)!r}')
         self._exclude = exclude
+        self._regex = re.compile(fr'[^\S{exclude}]')
 
     def get_params(self) -> dict[str, typ.Any]:
         return {
@@ -24,7 +25,7 @@ class RemoveWhitespace(_core.Operation):
         }
 
     def apply(self, s: str) -> str:
-        return re.sub(fr'[^\S{self._exclude}]', '', s)
+        return self._regex.sub('', s)
 
 
 class RemoveNullBytes(_core.Operation):
@@ -46,7 +47,7 @@ class Replace(_core.Operation):
          'i' for case insensitiveness, 'm' to make '^' and '$' match the start and end of lines,
          'x' to ignore whitespace, 'g' to continue after the first match, 'a' to match only ASCII characters.
         """
-        self._regex = re.compile(regex, flags=utils.regex_flags_to_int(flags))
+        self._regex = utils.compile_regex(regex, flags)
         self._repl = utils.unescape(repl)
         self._flags = flags
 
@@ -73,7 +74,7 @@ class Occurrences(_core.Operation):
          'x' to ignore whitespace, 'a' to match only ASCII characters.
         :param invert: If true, filters out strings that do match the regex.
         """
-        self._regex = re.compile(regex, flags=utils.regex_flags_to_int(flags))
+        self._regex = utils.compile_regex(regex, flags)
         self._flags = flags
         self._invert = invert
 
@@ -33,11 +33,11 @@ class AddLineNumbers(_core.Operation):
 class RemoveLineNumbers(_core.Operation):
     """Remove line number from the start of each line."""
 
+    # Line numbers cannot span over line breaks, the whole string can be processed at once
+    _LINE_NUMBER_REGEX = re.compile(r'^\d+ ', re.MULTILINE)
+
     def apply(self, s: str) -> str:
-        res = []
-        for line in s.split('\n'):
-            res.append(re.sub(r'^\d+ ', '', line))
-        return '\n'.join(res)
+        return self._LINE_NUMBER_REGEX.sub('', s)
 
 
 class Reverse(_core.Operation):
@@ -140,7 +140,7 @@ class Filter(_core.Operation):
         :param invert: If true, filters out strings that do match the regex.
         """
         self._sep = utils.unescape(sep)
-        self._regex = re.compile(regex, flags=utils.regex_flags_to_int(flags))
+        self._regex = utils.compile_regex(regex, flags)
         self._flags = flags
         self._invert = invert
 
@@ -1,4 +1,5 @@
 """This module defines various utility functions."""
+import functools
 import math
 import re
 
@@ -13,6 +14,8 @@ def flip_dict(d: dict) -> dict:
     return {v: k for k, v in d.items()}
 
 
+# Pure function called by many operation constructors with the same few separators
+@functools.lru_cache(maxsize=256)
 def unescape(s: str) -> str:
     """Unescape all escaped characters.
 
@@ -22,6 +25,8 @@ def unescape(s: str) -> str:
     return s.encode('utf8').decode('unicode_escape')
 
 
+# Only a handful of flag combinations are used in practice
+@functools.lru_cache(maxsize=64)
 def regex_flags_to_int(flags: str) -> int:
     """Convert string regex flags into an int that can then be passed to `re` module’s functions
 
@@ -44,6 +49,20 @@ def regex_flags_to_int(flags: str) -> int:
     return i
 
 
+# Unlike re’s own cache, this one cannot be flushed by unrelated regexes compiled elsewhere
+@functools.lru_cache(maxsize=2048)
+def compile_regex(regex: str, flags: str) -> re.Pattern[str]:
+    """Compile the given regex with the given string flags.
+    Compiled patterns are cached, instances created with the same arguments share the same pattern.
+
+    :param regex: The regex to compile.
+    :param flags: The flags as a string. May be one of [smaix].
+    :return: The compiled pattern.
+    :raises re.error: If the regex is invalid.
+    """
+    return re.compile(regex, flags=regex_flags_to_int(flags))
+
+
 _DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
 
 